@@ -10,6 +10,7 @@ CREATE SCHEMA IF NOT EXISTS disposition;
 -- =============================================================================
 
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- =============================================================================
 -- ENUM TYPES (in disposition schema)
@@ -188,6 +189,14 @@ CREATE INDEX IF NOT EXISTS idx_dsp_contacts_linkedin_cooldown ON disposition.con
 CREATE INDEX IF NOT EXISTS idx_dsp_contacts_enriched ON disposition.contacts(data_enriched_at);
 CREATE INDEX IF NOT EXISTS idx_dsp_contacts_available ON disposition.contacts(disposition_status, email_suppressed, email_cooldown_until)
     WHERE disposition_status IN ('fresh', 'retouch_eligible') AND email_suppressed = false;
+-- Contact listing: filter by client/status, newest first; trigram index serves the LIKE search
+CREATE INDEX IF NOT EXISTS idx_dsp_contacts_client_updated ON disposition.contacts(client_id, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_dsp_contacts_client_status_updated
+    ON disposition.contacts(client_id, disposition_status, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_dsp_contacts_search ON disposition.contacts USING gin (
+    LOWER(email) gin_trgm_ops, LOWER(first_name) gin_trgm_ops, LOWER(last_name) gin_trgm_ops,
+    LOWER(last_known_company) gin_trgm_ops, LOWER(company_domain) gin_trgm_ops
+);
 
 DROP TRIGGER IF EXISTS trg_contacts_timestamp ON disposition.contacts;
 CREATE TRIGGER trg_contacts_timestamp
@@ -133,7 +133,7 @@ class CharmBridgeWorker:
         try:
             request = build_waterfall_request(job)
             result = await self.waterfall.fill_campaign(request)
-            result_data = result.model_dump(mode="json")
+            result_data = result.to_dict()
 
             await self.db.pool.execute(
                 """
@@ -82,6 +82,47 @@ class CampaignFillEngine:
             backfill = selected_fresh[fresh_target : fresh_target + backfill_count]
             all_selected.extend(backfill)
 
+        return await self._assign_selected(all_selected, request, channel, warnings)
+
+    async def assign_contacts(
+        self, contacts: list[Contact], request: CampaignFillRequest
+    ) -> CampaignFillResult:
+        """Assign already-loaded fresh contacts without re-querying eligibility.
+
+        Used for contacts that were just inserted, so only company-level rules
+        and the title filter need checking; those use one company lookup.
+        """
+        max_per_co = request.max_per_company or self.settings.max_contacts_per_company
+        channel = request.channel.value
+        keywords = [kw.lower() for kw in request.title_keywords]
+
+        companies = await self.db.get_companies(
+            list({c.company_domain for c in contacts})
+        )
+        eligible: list[Contact] = []
+        for c in contacts:
+            co = companies.get(c.company_domain)
+            if co is None or co.company_suppressed or co.is_customer:
+                continue
+            if co.client_owner_id not in (None, request.client_id):
+                continue
+            if keywords:
+                title = (c.last_known_title or "").lower()
+                if not any(kw in title for kw in keywords):
+                    continue
+            eligible.append(c)
+
+        selected = self._apply_company_cap(eligible, max_per_co, {})[: request.volume]
+        return await self._assign_selected(selected, request, channel, [])
+
+    async def _assign_selected(
+        self,
+        all_selected: list[Contact],
+        request: CampaignFillRequest,
+        channel: str,
+        warnings: list[str],
+    ) -> CampaignFillResult:
+        """Assign the selected contacts and build the fill result."""
         if len(all_selected) < request.volume:
             warnings.append(
                 f"Volume shortfall: requested {request.volume}, assigned {len(all_selected)}"
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     postgres_db: str = "postgres"
     postgres_user: str = "postgres"
     postgres_password: str = ""
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int = 10
 
     # SQLite fallback for local dev (set USE_SQLITE=true)
     use_sqlite: bool = False
@@ -53,6 +55,8 @@ class Settings(BaseSettings):
     # TAM health thresholds (weeks)
     tam_warning_weeks: int = 8
     tam_critical_weeks: int = 4
+    # How long a TAM health reading is served from cache (seconds)
+    tam_cache_ttl_seconds: int = 60
 
     # --- External Provider API Keys ---
     ai_ark_api_url: str = "https://api.ai-ark.com/v1"
@@ -60,6 +64,13 @@ class Settings(BaseSettings):
 
     clay_webhook_url: str = ""
     clay_api_key: str = ""
+    # Public URL of the web app's /api/waterfall/clay/callback route. When set,
+    # fills running in the web app process have Clay post finished runs there
+    # instead of polling; other processes (e.g. the bridge worker) always poll.
+    clay_callback_url: str = ""
+    # Shared secret Clay must echo back as the callback's `token` query param.
+    # Callbacks are only requested when both this and clay_callback_url are set.
+    clay_callback_secret: str = ""
 
     jina_api_key: str = ""
     jina_api_url: str = "https://r.jina.ai"
@@ -71,6 +82,15 @@ class Settings(BaseSettings):
     waterfall_enabled: bool = True
     waterfall_max_credits_per_fill: float = 100.0
     waterfall_provider_order: str = "internal,ai_ark,clay,jina,spider"
+    # Max provider searches in flight at once, shared across concurrent fills
+    waterfall_concurrency: int = 4
+
+    # --- Web server (disposition-serve) ---
+    # "prod" serves without the reloader on uvloop/httptools; anything else is dev
+    env: str = "dev"
+    # Worker processes in prod. Caches and pending Clay callbacks are per process,
+    # so only raise this when Clay callbacks are not in use.
+    web_workers: int = 1
 
     # --- Bridge worker ---
     poll_interval: int = 5
@@ -128,6 +128,9 @@ CREATE INDEX IF NOT EXISTS idx_companies_owner ON companies(client_owner_id);
 CREATE INDEX IF NOT EXISTS idx_contacts_domain ON contacts(company_domain);
 CREATE INDEX IF NOT EXISTS idx_contacts_status ON contacts(disposition_status);
 CREATE INDEX IF NOT EXISTS idx_contacts_client ON contacts(client_id);
+CREATE INDEX IF NOT EXISTS idx_contacts_client_updated ON contacts(client_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_contacts_client_status_updated
+    ON contacts(client_id, disposition_status, updated_at);
 CREATE INDEX IF NOT EXISTS idx_contacts_enriched ON contacts(data_enriched_at);
 CREATE INDEX IF NOT EXISTS idx_history_contact ON disposition_history(contact_email, contact_client_id);
 CREATE INDEX IF NOT EXISTS idx_history_created ON disposition_history(created_at);
@@ -138,6 +141,56 @@ CREATE INDEX IF NOT EXISTS idx_snapshots_client ON tam_snapshots(client_id);
 """
 
 
+# ---------------------------------------------------------------------------
+# TAM queries
+# ---------------------------------------------------------------------------
+
+_TAM_POOL_NAMES = (
+    "total_universe", "never_touched", "in_cooldown", "available_now",
+    "permanent_suppress", "in_sequence", "won_customer",
+)
+
+# SQLite doesn't support FILTER, use SUM(CASE WHEN ... THEN 1 ELSE 0 END).
+# Takes the current time twice as parameters.
+_TAM_POOLS_COLUMNS = """
+    COUNT(*) AS total_universe,
+    SUM(CASE WHEN disposition_status = 'fresh' AND sequence_count = 0
+        THEN 1 ELSE 0 END) AS never_touched,
+    SUM(CASE WHEN disposition_status IN (
+            'completed_no_response', 'replied_neutral', 'replied_negative', 'lost_closed'
+        ) AND email_cooldown_until IS NOT NULL AND email_cooldown_until > ?
+        THEN 1 ELSE 0 END) AS in_cooldown,
+    SUM(CASE WHEN disposition_status IN ('fresh', 'retouch_eligible')
+        AND email_suppressed = 0
+        AND (email_cooldown_until IS NULL OR email_cooldown_until <= ?)
+        THEN 1 ELSE 0 END) AS available_now,
+    SUM(CASE WHEN disposition_status IN ('replied_hard_no', 'bounced', 'unsubscribed')
+        THEN 1 ELSE 0 END) AS permanent_suppress,
+    SUM(CASE WHEN disposition_status = 'in_sequence'
+        THEN 1 ELSE 0 END) AS in_sequence,
+    SUM(CASE WHEN disposition_status = 'won_customer'
+        THEN 1 ELSE 0 END) AS won_customer
+"""
+
+_INSERT_TAM_SNAPSHOT_SQL = """
+    INSERT INTO tam_snapshots (
+        id, snapshot_date, client_id, total_universe, never_touched,
+        in_cooldown, available_now, permanent_suppress, in_sequence,
+        won_customer, burn_rate_weekly, exhaustion_eta_weeks, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (snapshot_date, client_id) DO UPDATE SET
+        total_universe = EXCLUDED.total_universe,
+        never_touched = EXCLUDED.never_touched,
+        in_cooldown = EXCLUDED.in_cooldown,
+        available_now = EXCLUDED.available_now,
+        permanent_suppress = EXCLUDED.permanent_suppress,
+        in_sequence = EXCLUDED.in_sequence,
+        won_customer = EXCLUDED.won_customer,
+        burn_rate_weekly = EXCLUDED.burn_rate_weekly,
+        exhaustion_eta_weeks = EXCLUDED.exhaustion_eta_weeks
+"""
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -162,6 +215,55 @@ def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
     return {k: row[k] for k in row.keys()}
 
 
+_CONTACT_BOOL_COLUMNS = ("email_suppressed", "linkedin_suppressed", "phone_suppressed")
+_CONTACT_TIMESTAMP_COLUMNS = (
+    "disposition_updated_at", "email_last_contacted", "linkedin_last_contacted",
+    "phone_last_contacted", "email_cooldown_until", "linkedin_cooldown_until",
+    "phone_cooldown_until", "data_enriched_at", "created_at", "updated_at",
+)
+
+
+def _row_to_contact_dict(row: sqlite3.Row) -> dict[str, Any]:
+    """Contact row as the dict Contact.model_dump() would give, minus validation.
+
+    Integer flags become bools and datetime('now') defaults get the ISO "T".
+    """
+    d = _row_to_dict(row)
+    for key in _CONTACT_BOOL_COLUMNS:
+        d[key] = bool(d[key])
+    for key in _CONTACT_TIMESTAMP_COLUMNS:
+        value = d[key]
+        if value:
+            d[key] = value.replace(" ", "T", 1)
+    return d
+
+
+def _contact_filters(
+    client_id: str | None, status: str | None, search: str | None
+) -> tuple[str, list[Any]]:
+    """WHERE clause and params shared by the contact listing queries."""
+    where_clauses: list[str] = []
+    params: list[Any] = []
+
+    if client_id:
+        where_clauses.append("client_id = ?")
+        params.append(client_id)
+    if status:
+        where_clauses.append("disposition_status = ?")
+        params.append(status)
+    if search:
+        where_clauses.append(
+            "(LOWER(email) LIKE ? OR LOWER(first_name) LIKE ? "
+            "OR LOWER(last_name) LIKE ? OR LOWER(last_known_company) LIKE ? "
+            "OR LOWER(company_domain) LIKE ?)"
+        )
+        term = f"%{search.lower()}%"
+        params.extend([term, term, term, term, term])
+
+    where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    return where, params
+
+
 def _row_to_contact(row: sqlite3.Row) -> Contact:
     d = _row_to_dict(row)
     return Contact(**d)
@@ -172,6 +274,30 @@ def _row_to_company(row: sqlite3.Row) -> Company:
     return Company(**d)
 
 
+def _row_to_pools(row: sqlite3.Row) -> dict[str, int]:
+    return {name: row[name] or 0 for name in _TAM_POOL_NAMES}
+
+
+def _snapshot_params(
+    row_id: str, today: str, client_id: str | None, snapshot: dict, now: str
+) -> tuple:
+    return (
+        row_id,
+        today,
+        client_id,
+        snapshot.get("total_universe", 0),
+        snapshot.get("never_touched", 0),
+        snapshot.get("in_cooldown", 0),
+        snapshot.get("available_now", 0),
+        snapshot.get("permanent_suppress", 0),
+        snapshot.get("in_sequence", 0),
+        snapshot.get("won_customer", 0),
+        snapshot.get("burn_rate_weekly"),
+        snapshot.get("exhaustion_eta_weeks"),
+        now,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Database class
 # ---------------------------------------------------------------------------
@@ -198,6 +324,12 @@ class Database:
         self._conn.row_factory = sqlite3.Row
         await self._conn.execute("PRAGMA journal_mode=WAL")
         await self._conn.execute("PRAGMA foreign_keys=ON")
+        # WAL only needs syncing at checkpoints; keep hot pages and temp tables in memory
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute("PRAGMA cache_size=-65536")
+        await self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Lets set-based INSERT ... SELECT statements mint history row ids
+        await self._conn.create_function("uuid4", 0, lambda: str(uuid.uuid4()))
         await self._init_schema()
 
     async def _init_schema(self) -> None:
@@ -300,6 +432,46 @@ class Database:
         await self.conn.commit()
         return inserted
 
+    async def bulk_insert_contact_rows(
+        self, columns: tuple[str, ...], rows: list[tuple]
+    ) -> int:
+        """Insert raw contact rows (one tuple per contact, values in ``columns``
+        order), skipping duplicates. Returns count inserted.
+
+        Must include ``company_domain``; companies are created as needed and
+        their ``contacts_total`` recounted.
+        """
+        if not rows:
+            return 0
+        now = _now_str()
+        domain_idx = columns.index("company_domain")
+        domains = list({r[domain_idx] for r in rows})
+        params = [
+            tuple(v.isoformat() if isinstance(v, datetime) else v for v in r) + (now, now, now)
+            for r in rows
+        ]
+        placeholders = ", ".join("?" * (len(columns) + 3))
+
+        await self.conn.executemany(
+            "INSERT OR IGNORE INTO companies (domain) VALUES (?)",
+            [(d,) for d in domains],
+        )
+        before = self.conn.total_changes
+        await self.conn.executemany(
+            f"INSERT OR IGNORE INTO contacts ({', '.join(columns)}, "
+            f"disposition_updated_at, created_at, updated_at) VALUES ({placeholders})",
+            params,
+        )
+        inserted = self.conn.total_changes - before
+        await self.conn.executemany(
+            "UPDATE companies SET contacts_total = "
+            "(SELECT COUNT(*) FROM contacts WHERE company_domain = companies.domain) "
+            "WHERE domain = ?",
+            [(d,) for d in domains],
+        )
+        await self.conn.commit()
+        return inserted
+
     async def get_contact(self, email: str, client_id: str) -> Contact | None:
         cursor = await self.conn.execute(
             "SELECT * FROM contacts WHERE email = ? AND client_id = ?",
@@ -315,6 +487,22 @@ class Database:
         rows = await cursor.fetchall()
         return [_row_to_contact(r) for r in rows]
 
+    async def existing_contact_emails(
+        self, client_id: str, emails: list[str]
+    ) -> set[str]:
+        """Return which of the given emails already exist for a client."""
+        existing: set[str] = set()
+        # Chunked to stay under SQLite's bound-parameter limit
+        for i in range(0, len(emails), 500):
+            chunk = emails[i:i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = await self.conn.execute(
+                f"SELECT email FROM contacts WHERE client_id = ? AND email IN ({placeholders})",
+                (client_id, *chunk),
+            )
+            existing.update(r["email"] for r in await cursor.fetchall())
+        return existing
+
     async def update_contact_fields(
         self, email: str, client_id: str, **fields: Any
     ) -> Contact | None:
@@ -345,11 +533,105 @@ class Database:
 
         query = (
             f"UPDATE contacts SET {', '.join(set_clauses)} "
-            f"WHERE email = ? AND client_id = ?"
+            f"WHERE email = ? AND client_id = ? "
+            f"RETURNING *"
+        )
+        cursor = await self.conn.execute(query, values)
+        row = await cursor.fetchone()
+        await self.conn.commit()
+        return _row_to_contact(row) if row else None
+
+    async def transition_expired_cooldowns(
+        self,
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None = None,
+        triggered_by: str = "system",
+        **fields: Any,
+    ) -> int:
+        """Move every contact in from_statuses whose email cooldown has expired."""
+        return await self._transition_where(
+            "email_cooldown_until IS NOT NULL AND email_cooldown_until <= ?",
+            [_now_str()],
+            from_statuses, new_status, reason, triggered_by, fields,
+        )
+
+    async def transition_stale_contacts(
+        self,
+        months: int,
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None = None,
+        triggered_by: str = "system",
+        **fields: Any,
+    ) -> int:
+        """Move every contact in from_statuses enriched more than N months ago."""
+        cutoff = (_now() - timedelta(days=months * 30)).isoformat()
+        return await self._transition_where(
+            "data_enriched_at IS NOT NULL AND data_enriched_at < ?",
+            [cutoff],
+            from_statuses, new_status, reason, triggered_by, fields,
+        )
+
+    async def _transition_where(
+        self,
+        condition: str,
+        condition_params: list[Any],
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None,
+        triggered_by: str,
+        fields: dict[str, Any],
+    ) -> int:
+        """Set-based transition: log history and update matching contacts in SQL."""
+        if not from_statuses:
+            return 0
+        placeholders = ", ".join("?" for _ in from_statuses)
+        where = f"disposition_status IN ({placeholders}) AND {condition}"
+        where_params = [s.value for s in from_statuses] + condition_params
+        now = _now_str()
+
+        # History first, while the rows still carry their previous status
+        await self.conn.execute(
+            f"""
+            INSERT INTO disposition_history (
+                id, contact_email, contact_client_id, previous_status, new_status,
+                transition_reason, triggered_by, campaign_id, metadata, created_at
+            )
+            SELECT uuid4(), email, client_id, disposition_status, ?, ?, ?, NULL, '{{}}', ?
+            FROM contacts WHERE {where}
+            """,
+            [new_status.value, reason, triggered_by, now, *where_params],
+        )
+
+        set_clauses = ["disposition_status = ?", "disposition_updated_at = ?"]
+        values: list[Any] = [new_status.value, now]
+        for key, val in fields.items():
+            if isinstance(val, datetime):
+                val = val.isoformat()
+            elif isinstance(val, bool):
+                val = int(val)
+            set_clauses.append(f"{key} = ?")
+            values.append(val)
+        set_clauses.append("updated_at = ?")
+        values.append(now)
+
+        cursor = await self.conn.execute(
+            f"UPDATE contacts SET {', '.join(set_clauses)} WHERE {where}",
+            values + where_params,
+        )
+        await self.conn.commit()
+        return cursor.rowcount
+
+    async def suppress_contacts_by_domain(self, domain: str) -> int:
+        """Email-suppress every not-yet-suppressed contact at a domain."""
+        cursor = await self.conn.execute(
+            "UPDATE contacts SET email_suppressed = 1, updated_at = ? "
+            "WHERE company_domain = ? AND email_suppressed = 0",
+            (_now_str(), domain),
         )
-        await self.conn.execute(query, values)
         await self.conn.commit()
-        return await self.get_contact(email, client_id)
+        return cursor.rowcount
 
     # -----------------------------------------------------------------------
     # Company CRUD
@@ -369,6 +651,19 @@ class Database:
         row = await cursor.fetchone()
         return _row_to_company(row) if row else None
 
+    async def get_companies(self, domains: list[str]) -> dict[str, Company]:
+        """Fetch several companies at once, keyed by domain."""
+        companies: dict[str, Company] = {}
+        for i in range(0, len(domains), 500):
+            chunk = domains[i:i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = await self.conn.execute(
+                f"SELECT * FROM companies WHERE domain IN ({placeholders})", chunk
+            )
+            for row in await cursor.fetchall():
+                companies[row["domain"]] = _row_to_company(row)
+        return companies
+
     async def create_company(self, company: Company) -> Company:
         now = _now_str()
         await self.conn.execute(
@@ -518,44 +813,23 @@ class Database:
         where = "WHERE client_id = ?" if client_id else ""
         params: list[Any] = [client_id] if client_id else []
 
-        # SQLite doesn't support FILTER, use SUM(CASE WHEN ... THEN 1 ELSE 0 END)
         cursor = await self.conn.execute(
-            f"""
-            SELECT
-                COUNT(*) AS total_universe,
-                SUM(CASE WHEN disposition_status = 'fresh' AND sequence_count = 0
-                    THEN 1 ELSE 0 END) AS never_touched,
-                SUM(CASE WHEN disposition_status IN (
-                        'completed_no_response', 'replied_neutral', 'replied_negative', 'lost_closed'
-                    ) AND email_cooldown_until IS NOT NULL AND email_cooldown_until > ?
-                    THEN 1 ELSE 0 END) AS in_cooldown,
-                SUM(CASE WHEN disposition_status IN ('fresh', 'retouch_eligible')
-                    AND email_suppressed = 0
-                    AND (email_cooldown_until IS NULL OR email_cooldown_until <= ?)
-                    THEN 1 ELSE 0 END) AS available_now,
-                SUM(CASE WHEN disposition_status IN ('replied_hard_no', 'bounced', 'unsubscribed')
-                    THEN 1 ELSE 0 END) AS permanent_suppress,
-                SUM(CASE WHEN disposition_status = 'in_sequence'
-                    THEN 1 ELSE 0 END) AS in_sequence,
-                SUM(CASE WHEN disposition_status = 'won_customer'
-                    THEN 1 ELSE 0 END) AS won_customer
-            FROM contacts
-            {where}
-            """,
+            f"SELECT {_TAM_POOLS_COLUMNS} FROM contacts {where}",
             [now, now] + params,
         )
         row = await cursor.fetchone()
         if not row:
             return {}
-        return {
-            "total_universe": row["total_universe"] or 0,
-            "never_touched": row["never_touched"] or 0,
-            "in_cooldown": row["in_cooldown"] or 0,
-            "available_now": row["available_now"] or 0,
-            "permanent_suppress": row["permanent_suppress"] or 0,
-            "in_sequence": row["in_sequence"] or 0,
-            "won_customer": row["won_customer"] or 0,
-        }
+        return _row_to_pools(row)
+
+    async def get_tam_pools_by_client(self) -> dict[str, dict[str, int]]:
+        """Get TAM pool segmentation counts for every client in one query."""
+        now = _now_str()
+        cursor = await self.conn.execute(
+            f"SELECT client_id, {_TAM_POOLS_COLUMNS} FROM contacts GROUP BY client_id",
+            [now, now],
+        )
+        return {r["client_id"]: _row_to_pools(r) for r in await cursor.fetchall()}
 
     async def get_burn_rate(self, client_id: str | None = None) -> float:
         """Contacts moved to in_sequence in the last 7 days."""
@@ -584,43 +858,47 @@ class Database:
         row = await cursor.fetchone()
         return float(row["burned"]) if row else 0.0
 
+    async def get_burn_rates_by_client(self) -> dict[str, float]:
+        """Per-client contacts moved to in_sequence in the last 7 days."""
+        cutoff = (_now() - timedelta(days=7)).isoformat()
+        cursor = await self.conn.execute(
+            """
+            SELECT contact_client_id, COUNT(*) AS burned
+            FROM disposition_history
+            WHERE new_status = 'in_sequence'
+            AND created_at > ?
+            GROUP BY contact_client_id
+            """,
+            (cutoff,),
+        )
+        return {
+            r["contact_client_id"]: float(r["burned"]) for r in await cursor.fetchall()
+        }
+
     async def insert_tam_snapshot(self, snapshot: dict, client_id: str | None = None) -> None:
         """Insert a TAM snapshot record."""
         today = date.today().isoformat()
         row_id = str(uuid.uuid4())
         await self.conn.execute(
-            """
-            INSERT INTO tam_snapshots (
-                id, snapshot_date, client_id, total_universe, never_touched,
-                in_cooldown, available_now, permanent_suppress, in_sequence,
-                won_customer, burn_rate_weekly, exhaustion_eta_weeks, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (snapshot_date, client_id) DO UPDATE SET
-                total_universe = EXCLUDED.total_universe,
-                never_touched = EXCLUDED.never_touched,
-                in_cooldown = EXCLUDED.in_cooldown,
-                available_now = EXCLUDED.available_now,
-                permanent_suppress = EXCLUDED.permanent_suppress,
-                in_sequence = EXCLUDED.in_sequence,
-                won_customer = EXCLUDED.won_customer,
-                burn_rate_weekly = EXCLUDED.burn_rate_weekly,
-                exhaustion_eta_weeks = EXCLUDED.exhaustion_eta_weeks
-            """,
-            (
-                row_id,
-                today,
-                client_id,
-                snapshot.get("total_universe", 0),
-                snapshot.get("never_touched", 0),
-                snapshot.get("in_cooldown", 0),
-                snapshot.get("available_now", 0),
-                snapshot.get("permanent_suppress", 0),
-                snapshot.get("in_sequence", 0),
-                snapshot.get("won_customer", 0),
-                snapshot.get("burn_rate_weekly"),
-                snapshot.get("exhaustion_eta_weeks"),
-                _now_str(),
-            ),
+            _INSERT_TAM_SNAPSHOT_SQL,
+            _snapshot_params(row_id, today, client_id, snapshot, _now_str()),
+        )
+        await self.conn.commit()
+
+    async def bulk_insert_tam_snapshots(
+        self, snapshots: list[tuple[str | None, dict]]
+    ) -> None:
+        """Insert several ``(client_id, snapshot)`` TAM snapshots in one transaction."""
+        if not snapshots:
+            return
+        today = date.today().isoformat()
+        now = _now_str()
+        await self.conn.executemany(
+            _INSERT_TAM_SNAPSHOT_SQL,
+            [
+                _snapshot_params(str(uuid.uuid4()), today, client_id, snapshot, now)
+                for client_id, snapshot in snapshots
+            ],
         )
         await self.conn.commit()
 
@@ -782,34 +1060,15 @@ class Database:
     # Web UI queries
     # -----------------------------------------------------------------------
 
-    async def list_contacts(
+    async def _list_contact_rows(
         self,
         client_id: str | None = None,
         status: str | None = None,
         search: str | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Contact], int]:
-        """Paginated contact listing with optional filters."""
-        where_clauses: list[str] = []
-        params: list[Any] = []
-
-        if client_id:
-            where_clauses.append("client_id = ?")
-            params.append(client_id)
-        if status:
-            where_clauses.append("disposition_status = ?")
-            params.append(status)
-        if search:
-            where_clauses.append(
-                "(LOWER(email) LIKE ? OR LOWER(first_name) LIKE ? "
-                "OR LOWER(last_name) LIKE ? OR LOWER(last_known_company) LIKE ? "
-                "OR LOWER(company_domain) LIKE ?)"
-            )
-            term = f"%{search.lower()}%"
-            params.extend([term, term, term, term, term])
-
-        where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    ) -> tuple[list[sqlite3.Row], int]:
+        where, params = _contact_filters(client_id, status, search)
 
         cursor = await self.conn.execute(
             f"SELECT COUNT(*) AS total FROM contacts {where}", params
@@ -821,9 +1080,47 @@ class Database:
             f"SELECT * FROM contacts {where} ORDER BY updated_at DESC LIMIT ? OFFSET ?",
             params + [limit, offset],
         )
-        rows = await cursor.fetchall()
+        return await cursor.fetchall(), total
+
+    async def list_contacts(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[Contact], int]:
+        """Paginated contact listing with optional filters."""
+        rows, total = await self._list_contact_rows(client_id, status, search, limit, offset)
         return [_row_to_contact(r) for r in rows], total
 
+    async def list_contacts_raw(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Like list_contacts, but rows come back as API-ready dicts without validation."""
+        rows, total = await self._list_contact_rows(client_id, status, search, limit, offset)
+        return [_row_to_contact_dict(r) for r in rows], total
+
+    async def get_contacts_version(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> tuple[str, int]:
+        """Latest updated_at and row count for a filtered listing (used for ETags)."""
+        where, params = _contact_filters(client_id, status, search)
+        cursor = await self.conn.execute(
+            f"SELECT MAX(updated_at) AS latest, COUNT(*) AS total FROM contacts {where}",
+            params,
+        )
+        row = await cursor.fetchone()
+        return (row["latest"] or "", row["total"]) if row else ("", 0)
+
     async def list_owned_companies(
         self, client_id: str | None = None
     ) -> list[Company]:
@@ -6,6 +6,7 @@ Production database backend using asyncpg connection pool.
 from __future__ import annotations
 
 import json
+import operator
 import uuid
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
@@ -20,6 +21,35 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _contact_filters(
+    client_id: str | None, status: str | None, search: str | None
+) -> tuple[str, list[Any]]:
+    """WHERE clause and params shared by the contact listing queries."""
+    where_clauses: list[str] = []
+    params: list[Any] = []
+    idx = 0
+
+    if client_id:
+        idx += 1
+        where_clauses.append(f"client_id = ${idx}")
+        params.append(client_id)
+    if status:
+        idx += 1
+        where_clauses.append(f"disposition_status = ${idx}")
+        params.append(status)
+    if search:
+        idx += 1
+        where_clauses.append(
+            f"(LOWER(email) LIKE ${idx} OR LOWER(first_name) LIKE ${idx} "
+            f"OR LOWER(last_name) LIKE ${idx} OR LOWER(last_known_company) LIKE ${idx} "
+            f"OR LOWER(company_domain) LIKE ${idx})"
+        )
+        params.append(f"%{search.lower()}%")
+
+    where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    return where, params
+
+
 def _row_to_contact(row: asyncpg.Record) -> Contact:
     return Contact(**dict(row))
 
@@ -32,6 +62,73 @@ def _row_to_dict(row: asyncpg.Record) -> dict[str, Any]:
     return dict(row)
 
 
+_TAM_POOL_NAMES = (
+    "total_universe", "never_touched", "in_cooldown", "available_now",
+    "permanent_suppress", "in_sequence", "won_customer",
+)
+
+# Pool segmentation columns; $1 is the current time
+_TAM_POOLS_COLUMNS = """
+    COUNT(*) AS total_universe,
+    COUNT(*) FILTER (WHERE disposition_status = 'fresh' AND sequence_count = 0)
+        AS never_touched,
+    COUNT(*) FILTER (WHERE disposition_status IN (
+            'completed_no_response', 'replied_neutral',
+            'replied_negative', 'lost_closed'
+        ) AND email_cooldown_until IS NOT NULL AND email_cooldown_until > $1)
+        AS in_cooldown,
+    COUNT(*) FILTER (WHERE disposition_status IN ('fresh', 'retouch_eligible')
+        AND email_suppressed = false
+        AND (email_cooldown_until IS NULL OR email_cooldown_until <= $1))
+        AS available_now,
+    COUNT(*) FILTER (WHERE disposition_status IN (
+            'replied_hard_no', 'bounced', 'unsubscribed'))
+        AS permanent_suppress,
+    COUNT(*) FILTER (WHERE disposition_status = 'in_sequence')
+        AS in_sequence,
+    COUNT(*) FILTER (WHERE disposition_status = 'won_customer')
+        AS won_customer
+"""
+
+_INSERT_TAM_SNAPSHOT_SQL = """
+    INSERT INTO tam_snapshots (
+        snapshot_date, client_id, total_universe, never_touched,
+        in_cooldown, available_now, permanent_suppress, in_sequence,
+        won_customer, burn_rate_weekly, exhaustion_eta_weeks
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+    ON CONFLICT (snapshot_date, client_id) DO UPDATE SET
+        total_universe = EXCLUDED.total_universe,
+        never_touched = EXCLUDED.never_touched,
+        in_cooldown = EXCLUDED.in_cooldown,
+        available_now = EXCLUDED.available_now,
+        permanent_suppress = EXCLUDED.permanent_suppress,
+        in_sequence = EXCLUDED.in_sequence,
+        won_customer = EXCLUDED.won_customer,
+        burn_rate_weekly = EXCLUDED.burn_rate_weekly,
+        exhaustion_eta_weeks = EXCLUDED.exhaustion_eta_weeks
+"""
+
+
+def _row_to_pools(row: asyncpg.Record) -> dict[str, int]:
+    return {name: row[name] or 0 for name in _TAM_POOL_NAMES}
+
+
+def _snapshot_params(today: date, client_id: str | None, snapshot: dict) -> tuple:
+    return (
+        today,
+        client_id,
+        snapshot.get("total_universe", 0),
+        snapshot.get("never_touched", 0),
+        snapshot.get("in_cooldown", 0),
+        snapshot.get("available_now", 0),
+        snapshot.get("permanent_suppress", 0),
+        snapshot.get("in_sequence", 0),
+        snapshot.get("won_customer", 0),
+        snapshot.get("burn_rate_weekly"),
+        snapshot.get("exhaustion_eta_weeks"),
+    )
+
+
 class PostgresDatabase:
     """Async PostgreSQL database connection manager and CRUD operations."""
 
@@ -41,7 +138,9 @@ class PostgresDatabase:
 
     async def connect(self) -> None:
         self._pool = await asyncpg.create_pool(
-            self.settings.database_url, min_size=2, max_size=10,
+            self.settings.database_url,
+            min_size=self.settings.postgres_pool_min_size,
+            max_size=self.settings.postgres_pool_max_size,
             server_settings={"search_path": "disposition, public"},
         )
 
@@ -106,6 +205,45 @@ class PostgresDatabase:
                     pass
         return inserted
 
+    async def bulk_insert_contact_rows(
+        self, columns: tuple[str, ...], rows: list[tuple]
+    ) -> int:
+        """Insert raw contact rows (one tuple per contact, values in ``columns``
+        order), skipping duplicates. Returns count inserted.
+
+        Rows are COPYed into a temporary staging table, then moved over with a
+        single INSERT ... SELECT ... ON CONFLICT DO NOTHING, so existing
+        contacts never force a statement per row.
+        """
+        if not rows:
+            return 0
+        # The set-based insert picks an arbitrary row among repeats, so keep
+        # the first occurrence here like the row-by-row insert did
+        key = operator.itemgetter(columns.index("email"), columns.index("client_id"))
+        seen: set[tuple] = set()
+        unique_rows = []
+        for row in rows:
+            k = key(row)
+            if k not in seen:
+                seen.add(k)
+                unique_rows.append(row)
+        column_list = ", ".join(columns)
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                "CREATE TEMP TABLE contacts_staging "
+                "(LIKE contacts INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(
+                "contacts_staging", records=unique_rows, columns=columns
+            )
+            status = await conn.execute(
+                f"INSERT INTO contacts ({column_list}) "
+                f"SELECT {column_list} FROM contacts_staging "
+                f"ON CONFLICT (email, client_id) DO NOTHING"
+            )
+        # Command tag is "INSERT 0 <rows inserted>"
+        return int(status.rsplit(" ", 1)[1])
+
     async def get_contact(self, email: str, client_id: str) -> Contact | None:
         row = await self.pool.fetchrow(
             "SELECT * FROM contacts WHERE email = $1 AND client_id = $2",
@@ -119,6 +257,16 @@ class PostgresDatabase:
         )
         return [_row_to_contact(r) for r in rows]
 
+    async def existing_contact_emails(
+        self, client_id: str, emails: list[str]
+    ) -> set[str]:
+        """Return which of the given emails already exist for a client."""
+        rows = await self.pool.fetch(
+            "SELECT email FROM contacts WHERE client_id = $1 AND email = ANY($2::text[])",
+            client_id, emails,
+        )
+        return {r["email"] for r in rows}
+
     async def update_contact_fields(
         self, email: str, client_id: str, **fields: Any
     ) -> Contact | None:
@@ -148,6 +296,102 @@ class PostgresDatabase:
         row = await self.pool.fetchrow(query, *values)
         return _row_to_contact(row) if row else None
 
+    async def transition_expired_cooldowns(
+        self,
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None = None,
+        triggered_by: str = "system",
+        **fields: Any,
+    ) -> int:
+        """Move every contact in from_statuses whose email cooldown has expired."""
+        return await self._transition_where(
+            "email_cooldown_until IS NOT NULL AND email_cooldown_until <= $2",
+            [_now()],
+            from_statuses, new_status, reason, triggered_by, fields,
+        )
+
+    async def transition_stale_contacts(
+        self,
+        months: int,
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None = None,
+        triggered_by: str = "system",
+        **fields: Any,
+    ) -> int:
+        """Move every contact in from_statuses enriched more than N months ago."""
+        return await self._transition_where(
+            "data_enriched_at IS NOT NULL AND data_enriched_at < $2",
+            [_now() - timedelta(days=months * 30)],
+            from_statuses, new_status, reason, triggered_by, fields,
+        )
+
+    async def _transition_where(
+        self,
+        condition: str,
+        condition_params: list[Any],
+        from_statuses: list[DispositionStatus],
+        new_status: DispositionStatus,
+        reason: str | None,
+        triggered_by: str,
+        fields: dict[str, Any],
+    ) -> int:
+        """Set-based transition: update matching contacts and log history in one statement.
+
+        ``condition`` may use $2 onwards; $1 is the from_statuses array.
+        """
+        if not from_statuses:
+            return 0
+        values: list[Any] = [[s.value for s in from_statuses], *condition_params]
+        values += [new_status.value, _now(), reason, triggered_by]
+        n = len(values)
+        set_clauses = [
+            f"disposition_status = ${n - 3}::disposition.disposition_status",
+            f"disposition_updated_at = ${n - 2}",
+        ]
+        for key, val in fields.items():
+            values.append(val)
+            set_clauses.append(f"{key} = ${len(values)}")
+
+        count = await self.pool.fetchval(
+            f"""
+            WITH matched AS (
+                SELECT email, client_id, disposition_status AS previous_status
+                FROM contacts
+                WHERE disposition_status = ANY($1::disposition.disposition_status[])
+                AND {condition}
+                FOR UPDATE
+            ), moved AS (
+                UPDATE contacts c SET {', '.join(set_clauses)}
+                FROM matched m
+                WHERE c.email = m.email AND c.client_id = m.client_id
+                RETURNING c.email, c.client_id, m.previous_status
+            ), logged AS (
+                INSERT INTO disposition_history (
+                    contact_email, contact_client_id, previous_status, new_status,
+                    transition_reason, triggered_by
+                )
+                SELECT email, client_id, previous_status,
+                    ${n - 3}::disposition.disposition_status, ${n - 1}, ${n}
+                FROM moved
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM logged
+            """,
+            *values,
+        )
+        return count or 0
+
+    async def suppress_contacts_by_domain(self, domain: str) -> int:
+        """Email-suppress every not-yet-suppressed contact at a domain."""
+        result = await self.pool.execute(
+            "UPDATE contacts SET email_suppressed = TRUE "
+            "WHERE company_domain = $1 AND email_suppressed = FALSE",
+            domain,
+        )
+        return int(result.split()[-1])
+
     # -----------------------------------------------------------------------
     # Company CRUD
     # -----------------------------------------------------------------------
@@ -165,6 +409,13 @@ class PostgresDatabase:
         )
         return _row_to_company(row) if row else None
 
+    async def get_companies(self, domains: list[str]) -> dict[str, Company]:
+        """Fetch several companies at once, keyed by domain."""
+        rows = await self.pool.fetch(
+            "SELECT * FROM companies WHERE domain = ANY($1::text[])", domains
+        )
+        return {r["domain"]: _row_to_company(r) for r in rows}
+
     async def create_company(self, company: Company) -> Company:
         row = await self.pool.fetchrow(
             """
@@ -278,71 +529,25 @@ class PostgresDatabase:
         now = _now()
         if client_id:
             row = await self.pool.fetchrow(
-                """
-                SELECT
-                    COUNT(*) AS total_universe,
-                    COUNT(*) FILTER (WHERE disposition_status = 'fresh' AND sequence_count = 0)
-                        AS never_touched,
-                    COUNT(*) FILTER (WHERE disposition_status IN (
-                            'completed_no_response', 'replied_neutral',
-                            'replied_negative', 'lost_closed'
-                        ) AND email_cooldown_until IS NOT NULL AND email_cooldown_until > $1)
-                        AS in_cooldown,
-                    COUNT(*) FILTER (WHERE disposition_status IN ('fresh', 'retouch_eligible')
-                        AND email_suppressed = false
-                        AND (email_cooldown_until IS NULL OR email_cooldown_until <= $1))
-                        AS available_now,
-                    COUNT(*) FILTER (WHERE disposition_status IN (
-                            'replied_hard_no', 'bounced', 'unsubscribed'))
-                        AS permanent_suppress,
-                    COUNT(*) FILTER (WHERE disposition_status = 'in_sequence')
-                        AS in_sequence,
-                    COUNT(*) FILTER (WHERE disposition_status = 'won_customer')
-                        AS won_customer
-                FROM contacts
-                WHERE client_id = $2
-                """,
+                f"SELECT {_TAM_POOLS_COLUMNS} FROM contacts WHERE client_id = $2",
                 now, client_id,
             )
         else:
             row = await self.pool.fetchrow(
-                """
-                SELECT
-                    COUNT(*) AS total_universe,
-                    COUNT(*) FILTER (WHERE disposition_status = 'fresh' AND sequence_count = 0)
-                        AS never_touched,
-                    COUNT(*) FILTER (WHERE disposition_status IN (
-                            'completed_no_response', 'replied_neutral',
-                            'replied_negative', 'lost_closed'
-                        ) AND email_cooldown_until IS NOT NULL AND email_cooldown_until > $1)
-                        AS in_cooldown,
-                    COUNT(*) FILTER (WHERE disposition_status IN ('fresh', 'retouch_eligible')
-                        AND email_suppressed = false
-                        AND (email_cooldown_until IS NULL OR email_cooldown_until <= $1))
-                        AS available_now,
-                    COUNT(*) FILTER (WHERE disposition_status IN (
-                            'replied_hard_no', 'bounced', 'unsubscribed'))
-                        AS permanent_suppress,
-                    COUNT(*) FILTER (WHERE disposition_status = 'in_sequence')
-                        AS in_sequence,
-                    COUNT(*) FILTER (WHERE disposition_status = 'won_customer')
-                        AS won_customer
-                FROM contacts
-                """,
-                now,
+                f"SELECT {_TAM_POOLS_COLUMNS} FROM contacts", now
             )
 
         if not row:
             return {}
-        return {
-            "total_universe": row["total_universe"] or 0,
-            "never_touched": row["never_touched"] or 0,
-            "in_cooldown": row["in_cooldown"] or 0,
-            "available_now": row["available_now"] or 0,
-            "permanent_suppress": row["permanent_suppress"] or 0,
-            "in_sequence": row["in_sequence"] or 0,
-            "won_customer": row["won_customer"] or 0,
-        }
+        return _row_to_pools(row)
+
+    async def get_tam_pools_by_client(self) -> dict[str, dict[str, int]]:
+        """Get TAM pool segmentation counts for every client in one query."""
+        rows = await self.pool.fetch(
+            f"SELECT client_id, {_TAM_POOLS_COLUMNS} FROM contacts GROUP BY client_id",
+            _now(),
+        )
+        return {r["client_id"]: _row_to_pools(r) for r in rows}
 
     async def get_burn_rate(self, client_id: str | None = None) -> float:
         """Contacts moved to in_sequence in the last 7 days."""
@@ -370,41 +575,45 @@ class PostgresDatabase:
             )
         return float(row["burned"]) if row else 0.0
 
+    async def get_burn_rates_by_client(self) -> dict[str, float]:
+        """Per-client contacts moved to in_sequence in the last 7 days."""
+        rows = await self.pool.fetch(
+            """
+            SELECT contact_client_id, COUNT(*) AS burned
+            FROM disposition_history
+            WHERE new_status = 'in_sequence'
+            AND created_at > $1
+            GROUP BY contact_client_id
+            """,
+            _now() - timedelta(days=7),
+        )
+        return {r["contact_client_id"]: float(r["burned"]) for r in rows}
+
     async def insert_tam_snapshot(
         self, snapshot: dict, client_id: str | None = None
     ) -> None:
         """Insert a TAM snapshot record."""
-        today = date.today()
         await self.pool.execute(
-            """
-            INSERT INTO tam_snapshots (
-                snapshot_date, client_id, total_universe, never_touched,
-                in_cooldown, available_now, permanent_suppress, in_sequence,
-                won_customer, burn_rate_weekly, exhaustion_eta_weeks
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            ON CONFLICT (snapshot_date, client_id) DO UPDATE SET
-                total_universe = EXCLUDED.total_universe,
-                never_touched = EXCLUDED.never_touched,
-                in_cooldown = EXCLUDED.in_cooldown,
-                available_now = EXCLUDED.available_now,
-                permanent_suppress = EXCLUDED.permanent_suppress,
-                in_sequence = EXCLUDED.in_sequence,
-                won_customer = EXCLUDED.won_customer,
-                burn_rate_weekly = EXCLUDED.burn_rate_weekly,
-                exhaustion_eta_weeks = EXCLUDED.exhaustion_eta_weeks
-            """,
-            today, client_id,
-            snapshot.get("total_universe", 0),
-            snapshot.get("never_touched", 0),
-            snapshot.get("in_cooldown", 0),
-            snapshot.get("available_now", 0),
-            snapshot.get("permanent_suppress", 0),
-            snapshot.get("in_sequence", 0),
-            snapshot.get("won_customer", 0),
-            snapshot.get("burn_rate_weekly"),
-            snapshot.get("exhaustion_eta_weeks"),
+            _INSERT_TAM_SNAPSHOT_SQL,
+            *_snapshot_params(date.today(), client_id, snapshot),
         )
 
+    async def bulk_insert_tam_snapshots(
+        self, snapshots: list[tuple[str | None, dict]]
+    ) -> None:
+        """Insert several ``(client_id, snapshot)`` TAM snapshots in one transaction."""
+        if not snapshots:
+            return
+        today = date.today()
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.executemany(
+                _INSERT_TAM_SNAPSHOT_SQL,
+                [
+                    _snapshot_params(today, client_id, snapshot)
+                    for client_id, snapshot in snapshots
+                ],
+            )
+
     async def get_snapshots(
         self, client_id: str | None = None, days: int = 30
     ) -> list[dict]:
@@ -562,37 +771,16 @@ class PostgresDatabase:
     # Web UI queries
     # -----------------------------------------------------------------------
 
-    async def list_contacts(
+    async def _list_contact_rows(
         self,
         client_id: str | None = None,
         status: str | None = None,
         search: str | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Contact], int]:
-        """Paginated contact listing with optional filters."""
-        where_clauses: list[str] = []
-        params: list[Any] = []
-        idx = 0
-
-        if client_id:
-            idx += 1
-            where_clauses.append(f"client_id = ${idx}")
-            params.append(client_id)
-        if status:
-            idx += 1
-            where_clauses.append(f"disposition_status = ${idx}")
-            params.append(status)
-        if search:
-            idx += 1
-            where_clauses.append(
-                f"(LOWER(email) LIKE ${idx} OR LOWER(first_name) LIKE ${idx} "
-                f"OR LOWER(last_name) LIKE ${idx} OR LOWER(last_known_company) LIKE ${idx} "
-                f"OR LOWER(company_domain) LIKE ${idx})"
-            )
-            params.append(f"%{search.lower()}%")
-
-        where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    ) -> tuple[list[asyncpg.Record], int]:
+        where, params = _contact_filters(client_id, status, search)
+        idx = len(params)
 
         count_row = await self.pool.fetchrow(
             f"SELECT COUNT(*) AS total FROM contacts {where}", *params
@@ -609,8 +797,49 @@ class PostgresDatabase:
             f"LIMIT ${limit_idx} OFFSET ${offset_idx}",
             *params, limit, offset,
         )
+        return rows, total
+
+    async def list_contacts(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[Contact], int]:
+        """Paginated contact listing with optional filters."""
+        rows, total = await self._list_contact_rows(client_id, status, search, limit, offset)
         return [_row_to_contact(r) for r in rows], total
 
+    async def list_contacts_raw(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Like list_contacts, but rows come back as API-ready dicts without validation."""
+        rows, total = await self._list_contact_rows(client_id, status, search, limit, offset)
+        return [dict(r) for r in rows], total
+
+    async def get_contacts_version(
+        self,
+        client_id: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> tuple[str, int]:
+        """Latest updated_at and row count for a filtered listing (used for ETags)."""
+        where, params = _contact_filters(client_id, status, search)
+        row = await self.pool.fetchrow(
+            f"SELECT MAX(updated_at) AS latest, COUNT(*) AS total FROM contacts {where}",
+            *params,
+        )
+        if row is None:
+            return "", 0
+        latest = row["latest"]
+        return (latest.isoformat() if latest else ""), row["total"]
+
     async def list_owned_companies(
         self, client_id: str | None = None
     ) -> list[Company]:
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import enum
+from bisect import bisect_right
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from lead_disposition.core.config import Settings
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -81,6 +86,15 @@ class Contact(BaseModel):
     updated_at: datetime | None = None
 
 
+# Contact columns in the row-tuple layout bulk_insert_contact_rows takes,
+# shared by CSV import and waterfall write-back
+CONTACT_ROW_COLUMNS: tuple[str, ...] = (
+    "email", "client_id", "company_domain", "first_name", "last_name",
+    "last_known_title", "last_known_company", "disposition_status",
+    "data_enriched_at", "source_system", "source_id",
+)
+
+
 class Company(BaseModel):
     domain: str
     name: str | None = None
@@ -144,6 +158,10 @@ class TAMSnapshot(BaseModel):
     created_at: datetime | None = None
 
 
+# Health status per band, from below the critical threshold upward
+_HEALTH_BANDS = ("critical", "warning", "healthy")
+
+
 class TAMHealth(BaseModel):
     """Computed TAM health metrics (not persisted directly)."""
 
@@ -158,6 +176,15 @@ class TAMHealth(BaseModel):
     exhaustion_eta_weeks: float | None = None
     health_status: str = "healthy"  # healthy, warning, critical
 
+    @staticmethod
+    def derive_status(eta_weeks: float | None, settings: Settings) -> str:
+        """Health status for an exhaustion ETA; no ETA (zero burn) is healthy."""
+        if eta_weeks is None:
+            return "healthy"
+        # bisect_right so an ETA exactly on a threshold falls in the band above it
+        thresholds = (settings.tam_critical_weeks, settings.tam_warning_weeks)
+        return _HEALTH_BANDS[bisect_right(thresholds, eta_weeks)]
+
 
 class CampaignFillRequest(BaseModel):
     """Input for the campaign fill engine."""
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, TextIO
 
 from lead_disposition.core.config import Settings
 from lead_disposition.core.database import Database
-from lead_disposition.core.models import Contact, DispositionStatus
+from lead_disposition.core.models import CONTACT_ROW_COLUMNS, DispositionStatus
 
 
 # Default column mappings for CSV import
@@ -22,6 +25,9 @@ DEFAULT_CSV_COLUMNS = {
     "company": "last_known_company",
 }
 
+# Parsed contacts buffered before each insert
+IMPORT_BATCH_SIZE = 1000
+
 
 class CSVImporter:
     """Import contacts from CSV files into the disposition system."""
@@ -46,7 +52,7 @@ class CSVImporter:
         """
         path = Path(file_path)
         with open(path, encoding="utf-8-sig") as f:
-            return await self._import_reader(f, client_id, column_map)
+            return await self._import_reader(f, client_id, column_map, path.name)
 
     async def import_csv_string(
         self,
@@ -55,61 +61,57 @@ class CSVImporter:
         column_map: dict[str, str] | None = None,
     ) -> ImportResult:
         """Import contacts from a CSV string."""
-        return await self._import_reader(io.StringIO(csv_content), client_id, column_map)
+        return await self._import_reader(
+            io.StringIO(csv_content), client_id, column_map, "csv_string"
+        )
+
+    async def import_csv_stream(
+        self,
+        stream: IO[bytes],
+        client_id: str,
+        column_map: dict[str, str] | None = None,
+        source_id: str = "csv_upload",
+    ) -> ImportResult:
+        """Import contacts from a binary CSV stream (e.g. an uploaded file).
+
+        The stream is decoded and parsed in a worker thread, a batch at a
+        time, rather than read into memory up front.
+        """
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            return await self._import_reader(text, client_id, column_map, source_id)
+        finally:
+            # Leave the underlying stream open for its owner
+            text.detach()
 
     async def _import_reader(
         self,
-        reader_source: io.TextIOBase | io.StringIO,
+        reader_source: TextIO,
         client_id: str,
         column_map: dict[str, str] | None,
+        source_id: str,
     ) -> ImportResult:
-        cmap = column_map or DEFAULT_CSV_COLUMNS
-        reader = csv.DictReader(reader_source)
-
-        contacts: list[Contact] = []
-        skipped = 0
         errors: list[str] = []
-
-        for row_num, row in enumerate(reader, start=2):
-            email_col = cmap.get("email", "email")
-            email = row.get(email_col, "").strip().lower()
-            if not email or "@" not in email:
-                skipped += 1
-                errors.append(f"Row {row_num}: invalid or missing email")
-                continue
-
-            domain_col = cmap.get("company_domain", "company_domain")
-            domain = row.get(domain_col, "").strip().lower()
-            if not domain:
-                # Try to extract from email
-                domain = email.split("@")[1] if "@" in email else ""
-            if not domain:
-                skipped += 1
-                errors.append(f"Row {row_num}: no company_domain for {email}")
-                continue
-
-            contact = Contact(
-                email=email,
-                client_id=client_id,
-                company_domain=domain,
-                first_name=row.get(cmap.get("first_name", "first_name"), "").strip() or None,
-                last_name=row.get(cmap.get("last_name", "last_name"), "").strip() or None,
-                last_known_title=row.get(cmap.get("title", "last_known_title"), "").strip() or None,
-                last_known_company=row.get(
-                    cmap.get("company", "last_known_company"), ""
-                ).strip() or None,
-                disposition_status=DispositionStatus.FRESH,
-                data_enriched_at=datetime.now(timezone.utc),
-                source_system="csv",
-                source_id=str(Path(reader_source.name).name) if hasattr(reader_source, "name") else "csv_string",
-            )
-            contacts.append(contact)
-
-        inserted = await self.db.bulk_create_contacts(contacts)
-        duplicates = len(contacts) - inserted
-
+        batches = _parse_batches(
+            reader_source, client_id, column_map or DEFAULT_CSV_COLUMNS, source_id, errors
+        )
+        total_contacts = 0
+        inserted = 0
+
+        # Reading and parsing run in a worker thread a batch at a time, so big
+        # files never block the event loop; only the inserts run on it
+        while True:
+            rows = await asyncio.to_thread(next, batches, None)
+            if rows is None:
+                break
+            inserted += await self.db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, rows)
+            total_contacts += len(rows)
+        duplicates = total_contacts - inserted
+
+        # Every skipped row records exactly one error
+        skipped = len(errors)
         return ImportResult(
-            total_rows=len(contacts) + skipped,
+            total_rows=total_contacts + skipped,
             imported=inserted,
             duplicates=duplicates,
             skipped=skipped,
@@ -117,6 +119,80 @@ class CSVImporter:
         )
 
 
+def _parse_batches(
+    reader_source: TextIO,
+    client_id: str,
+    cmap: dict[str, str],
+    source_id: str,
+    errors: list[str],
+) -> Iterator[list[tuple]]:
+    """Parse CSV rows into CONTACT_ROW_COLUMNS tuples, IMPORT_BATCH_SIZE at a time.
+
+    Rows that can't be imported are skipped with a message appended to ``errors``.
+    """
+    # Plain csv.reader with header positions resolved once; DictReader
+    # would build a dict per row. Absent columns point at a trailing ""
+    # cell appended to every row.
+    reader = csv.reader(reader_source)
+    header = next(reader, [])
+    width = len(header)
+    position = {name: i for i, name in enumerate(header)}
+
+    def column(field: str, default: str) -> int:
+        return position.get(cmap.get(field, default), width)
+
+    email_i = column("email", "email")
+    domain_i = column("company_domain", "company_domain")
+    first_name_i = column("first_name", "first_name")
+    last_name_i = column("last_name", "last_name")
+    title_i = column("title", "last_known_title")
+    company_i = column("company", "last_known_company")
+    padding = [""] * width
+
+    rows: list[tuple] = []
+    now = datetime.now(timezone.utc)
+
+    for row_num, row in enumerate((r for r in reader if r), start=2):
+        if len(row) != width:
+            row = (row + padding)[:width]
+        row.append("")
+
+        email = row[email_i].strip().lower()
+        if not email or "@" not in email:
+            errors.append(f"Row {row_num}: invalid or missing email")
+            continue
+
+        domain = row[domain_i].strip().lower()
+        if not domain:
+            # Try to extract from email
+            domain = email.split("@")[1] if "@" in email else ""
+        if not domain:
+            errors.append(f"Row {row_num}: no company_domain for {email}")
+            continue
+
+        rows.append((
+            email,
+            client_id,
+            domain,
+            row[first_name_i].strip() or None,
+            row[last_name_i].strip() or None,
+            row[title_i].strip() or None,
+            row[company_i].strip() or None,
+            DispositionStatus.FRESH.value,
+            now,
+            "csv",
+            source_id,
+        ))
+
+        # Hand off in batches so large files never sit in memory whole
+        if len(rows) >= IMPORT_BATCH_SIZE:
+            yield rows
+            rows = []
+
+    if rows:
+        yield rows
+
+
 class ImportResult:
     """Result of an import operation."""
 
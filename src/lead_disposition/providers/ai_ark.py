@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import httpx
+import orjson
 
 from lead_disposition.core.config import Settings
 from lead_disposition.providers.base import (
@@ -10,6 +11,8 @@ from lead_disposition.providers.base import (
     LeadProvider,
     ProviderResult,
     SearchCriteria,
+    create_http_client,
+    host_semaphore,
 )
 
 
@@ -28,13 +31,14 @@ class AIArkProvider(LeadProvider):
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = create_http_client(
                 base_url=self.api_url,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                transport=self._transport,
             )
         return self._client
 
@@ -60,9 +64,10 @@ class AIArkProvider(LeadProvider):
             payload["company_domains"] = criteria.company_domains
 
         try:
-            resp = await self.client.post("/people/search", json=payload)
+            async with host_semaphore(self.api_url):
+                resp = await self.client.post("/people/search", json=payload)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
             return ProviderResult(errors=[f"AI Ark API error: {e.response.status_code}"])
         except httpx.RequestError as e:
@@ -97,11 +102,12 @@ class AIArkProvider(LeadProvider):
             credits_consumed=len(leads) * 1.0,
         )
 
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         if not self.api_key:
             return False
         try:
-            resp = await self.client.get("/health")
+            async with host_semaphore(self.api_url):
+                resp = await self.client.get("/health")
             return resp.status_code < 500
         except httpx.RequestError:
             return False
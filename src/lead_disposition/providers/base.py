@@ -2,11 +2,92 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
+from urllib.parse import urlsplit
 
+import httpx
 from pydantic import BaseModel, Field
 
+# Connection attempts retried by the transport on connect errors/timeouts
+HTTP_RETRIES = 2
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+# Limits for one transport shared by every provider in a process
+SHARED_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# How long a health probe result is reused before the provider is probed again
+HEALTH_CACHE_TTL_SECONDS = 30.0
+
+# Max concurrent requests to any one host, shared by all providers
+HOST_CONCURRENCY = 8
+
+# Per-event-loop registry of host semaphores (asyncio primitives are loop-bound)
+_host_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    """Return the shared semaphore limiting concurrent requests to `url`'s host."""
+    host = urlsplit(url).netloc
+    registry = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    sem = registry.get(host)
+    if sem is None:
+        sem = registry[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return sem
+
+
+def create_http_transport(limits: httpx.Limits = HTTP_LIMITS) -> httpx.AsyncHTTPTransport:
+    """Pooled HTTP/2 transport with connect retries."""
+    return httpx.AsyncHTTPTransport(http2=True, retries=HTTP_RETRIES, limits=limits)
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Sends through a transport owned elsewhere; aclose() leaves it open."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def create_http_client(
+    *,
+    base_url: str = "",
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Build a provider HTTP client on a pooled HTTP/2 transport with connect retries.
+
+    Keep-alive connections are reused for the lifetime of the client, so
+    repeated requests to the same origin skip TCP/TLS setup. Pass a shared
+    ``transport`` to pool connections across providers; closing the client
+    then leaves it open for its owner to close.
+    """
+    if transport is None:
+        transport = create_http_transport()
+    else:
+        transport = _BorrowedTransport(transport)
+    return httpx.AsyncClient(
+        base_url=base_url, headers=headers, timeout=timeout, transport=transport
+    )
+
+
+def capitalize_lower(s: str) -> str:
+    """Capitalize a string that is already lowercase (e.g. a lowercased email part).
+
+    Equivalent to str.capitalize() for such input, without re-lowercasing the tail.
+    """
+    return s[:1].upper() + s[1:]
+
 
 class SearchCriteria(BaseModel):
     """Criteria for searching external lead sources."""
@@ -55,14 +136,38 @@ class LeadProvider(ABC):
     provider_name: str = "unknown"
     priority: int = 0
 
+    _health_cache: tuple[float, bool] | None = None
+    _transport: httpx.AsyncBaseTransport | None = None
+
+    def use_transport(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Send this provider's requests through a shared transport.
+
+        Call before the provider's first request; the owner of the transport closes it.
+        """
+        self._transport = transport
+
     @abstractmethod
     async def search_leads(self, criteria: SearchCriteria) -> ProviderResult:
         """Search for leads matching the given criteria."""
         ...
 
-    @abstractmethod
     async def health_check(self) -> bool:
-        """Check if the provider API is reachable and authenticated."""
+        """Check if the provider API is reachable and authenticated.
+
+        Probe results are cached for HEALTH_CACHE_TTL_SECONDS so frequent
+        polling doesn't hit the provider on every call.
+        """
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+            return cached[1]
+        healthy = await self._probe_health()
+        self._health_cache = (now, healthy)
+        return healthy
+
+    @abstractmethod
+    async def _probe_health(self) -> bool:
+        """Make the actual (lightweight) reachability check against the provider."""
         ...
 
     async def close(self) -> None:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 
 from lead_disposition.core.config import Settings
 from lead_disposition.providers.base import (
@@ -12,8 +14,25 @@ from lead_disposition.providers.base import (
     LeadProvider,
     ProviderResult,
     SearchCriteria,
+    create_http_client,
+    host_semaphore,
 )
 
+# Clay runs awaiting a callback in this process, keyed by run ID
+_pending_runs: dict[str, asyncio.Future[dict]] = {}
+
+
+def resolve_clay_run(run_id: str, data: dict) -> bool:
+    """Hand a Clay callback payload to the fill waiting on `run_id`.
+
+    Returns False if nothing in this process is waiting for that run.
+    """
+    fut = _pending_runs.get(run_id)
+    if fut is None or fut.done():
+        return False
+    fut.set_result(data)
+    return True
+
 
 class ClayProvider(LeadProvider):
     """Clay - Webhook-based waterfall enrichment with 150+ data providers."""
@@ -21,27 +40,43 @@ class ClayProvider(LeadProvider):
     provider_name = "clay"
     priority = 2
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, receive_callbacks: bool = False):
+        """``receive_callbacks`` is only for processes serving the callback route."""
         self.settings = settings
         self.webhook_url = settings.clay_webhook_url
         self.api_key = settings.clay_api_key
+        self.receive_callbacks = receive_callbacks
         self._client: httpx.AsyncClient | None = None
 
+    @property
+    def callback_url(self) -> str | None:
+        """Callback route carrying the shared secret, or None to fall back to polling."""
+        if not self.receive_callbacks:
+            return None
+        if not (self.settings.clay_callback_url and self.settings.clay_callback_secret):
+            return None
+        sep = "&" if "?" in self.settings.clay_callback_url else "?"
+        token = urlencode({"token": self.settings.clay_callback_secret})
+        return f"{self.settings.clay_callback_url}{sep}{token}"
+
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
             headers = {"Content-Type": "application/json"}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
-            self._client = httpx.AsyncClient(headers=headers, timeout=60.0)
+            self._client = create_http_client(
+                headers=headers, timeout=60.0, transport=self._transport
+            )
         return self._client
 
     async def search_leads(self, criteria: SearchCriteria) -> ProviderResult:
         """Push search criteria to Clay webhook for waterfall enrichment.
 
         Clay processes asynchronously (1-2 min per batch). This adapter
-        pushes the request and collects results via a callback or polling
-        mechanism.
+        pushes the request and collects results via a callback (when
+        clay_callback_url and clay_callback_secret are configured) or by
+        polling the run.
         """
         if not self.webhook_url:
             return ProviderResult(errors=["Clay webhook URL not configured"])
@@ -56,11 +91,15 @@ class ClayProvider(LeadProvider):
             "company_domains": criteria.company_domains,
             "limit": criteria.limit,
         }
+        callback_url = self.callback_url
+        if callback_url:
+            payload["callback_url"] = callback_url
 
         try:
-            resp = await self.client.post(self.webhook_url, json=payload)
+            async with host_semaphore(self.webhook_url):
+                resp = await self.client.post(self.webhook_url, json=payload)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
             return ProviderResult(errors=[f"Clay webhook error: {e.response.status_code}"])
         except httpx.RequestError as e:
@@ -71,8 +110,10 @@ class ClayProvider(LeadProvider):
         if "results" in data or "rows" in data:
             return self._parse_results(data)
 
-        # If Clay returns a job/run ID, poll for completion
+        # If Clay returns a job/run ID, wait for its callback or poll for completion
         run_id = data.get("run_id") or data.get("id")
+        if run_id and callback_url:
+            return await self._wait_for_callback(str(run_id))
         if run_id and self.api_key:
             return await self._poll_results(run_id)
 
@@ -115,6 +156,31 @@ class ClayProvider(LeadProvider):
             credits_consumed=len(leads) * 2.0,  # Clay averages ~2 credits per lead
         )
 
+    async def _wait_for_callback(self, run_id: str, max_wait: int = 180) -> ProviderResult:
+        """Wait for Clay to post the finished run to the callback route."""
+        fut: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        _pending_runs[run_id] = fut
+        try:
+            data: dict | None = await asyncio.wait_for(fut, timeout=max_wait)
+        except TimeoutError:
+            data = None
+        finally:
+            _pending_runs.pop(run_id, None)
+
+        if data is None:
+            # The run is already paid for; fetch it directly if the callback never came
+            if self.api_key:
+                return await self._poll_results(run_id)
+            return ProviderResult(
+                errors=[f"Clay run {run_id} timed out after {max_wait}s"]
+            )
+
+        if data.get("status", "") in ("failed", "error"):
+            return ProviderResult(
+                errors=[f"Clay run {run_id} failed: {data.get('error', 'unknown')}"]
+            )
+        return self._parse_results(data)
+
     async def _poll_results(self, run_id: str, max_wait: int = 180) -> ProviderResult:
         """Poll Clay API for completed enrichment results."""
         poll_url = f"https://api.clay.com/v1/runs/{run_id}"
@@ -124,26 +190,29 @@ class ClayProvider(LeadProvider):
         while elapsed < max_wait:
             await asyncio.sleep(interval)
             elapsed += interval
+            # The transport only retries failed connects; a timed-out or dropped
+            # poll just waits for the next interval rather than abandoning the run
             try:
-                resp = await self.client.get(poll_url)
-                if resp.status_code != 200:
-                    continue
-                data = resp.json()
-                status = data.get("status", "")
-                if status in ("completed", "done"):
-                    return self._parse_results(data)
-                if status in ("failed", "error"):
-                    return ProviderResult(
-                        errors=[f"Clay run {run_id} failed: {data.get('error', 'unknown')}"]
-                    )
+                async with host_semaphore(poll_url):
+                    resp = await self.client.get(poll_url)
             except httpx.RequestError:
                 continue
+            if resp.status_code != 200:
+                continue
+            data = orjson.loads(resp.content)
+            status = data.get("status", "")
+            if status in ("completed", "done"):
+                return self._parse_results(data)
+            if status in ("failed", "error"):
+                return ProviderResult(
+                    errors=[f"Clay run {run_id} failed: {data.get('error', 'unknown')}"]
+                )
 
         return ProviderResult(
             errors=[f"Clay run {run_id} timed out after {max_wait}s"]
         )
 
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         return bool(self.webhook_url)
 
     async def close(self) -> None:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
 
 import httpx
 
@@ -12,12 +14,44 @@ from lead_disposition.providers.base import (
     LeadProvider,
     ProviderResult,
     SearchCriteria,
+    capitalize_lower,
+    create_http_client,
+    host_semaphore,
 )
 
 # Regex patterns for extracting contact info from scraped pages
-EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+EMAIL_PATTERN = re.compile(
+    r"(?P<email>(?P<local>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))"
+)
 LINKEDIN_PATTERN = re.compile(r"https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+/?")
 
+# Characters carried over between streamed chunks so an address split across
+# a chunk boundary is still matched on the next scan
+STREAM_TAIL_CHARS = 128
+
+# Addresses extracted per Reader URL, reused for an hour so repeat scrapes of
+# the same company in this process don't spend credits again
+PAGE_CACHE_TTL_SECONDS = 3600.0
+PAGE_CACHE_MAX_ENTRIES = 2048
+_page_cache: dict[str, tuple[float, list[tuple[str, str]]]] = {}
+
+
+def _get_cached_page(reader_url: str) -> list[tuple[str, str]] | None:
+    entry = _page_cache.get(reader_url)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del _page_cache[reader_url]
+        return None
+    return entry[1]
+
+
+def _cache_page(reader_url: str, addresses: list[tuple[str, str]]) -> None:
+    if len(_page_cache) >= PAGE_CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _page_cache[next(iter(_page_cache))]
+    _page_cache[reader_url] = (time.monotonic() + PAGE_CACHE_TTL_SECONDS, addresses)
+
 
 class JinaProvider(LeadProvider):
     """Jina AI Reader - Extract leads from company websites via web scraping."""
@@ -37,7 +71,9 @@ class JinaProvider(LeadProvider):
             headers: dict[str, str] = {"Accept": "text/plain"}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
-            self._client = httpx.AsyncClient(headers=headers, timeout=30.0)
+            self._client = create_http_client(
+                headers=headers, timeout=30.0, transport=self._transport
+            )
         return self._client
 
     async def search_leads(self, criteria: SearchCriteria) -> ProviderResult:
@@ -53,24 +89,37 @@ class JinaProvider(LeadProvider):
         all_leads: list[ExternalLead] = []
         errors: list[str] = []
         credits = 0.0
+        # Shared across domains: an address is emitted once per search, and its
+        # size is the number of leads found so far
+        seen_emails: set[str] = set()
 
-        for domain in criteria.company_domains[: criteria.limit]:
-            result = await self._scrape_company(domain, criteria)
+        # Scrape domains concurrently; host_semaphore bounds load on the Reader
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._scrape_company(domain, criteria.limit, seen_emails))
+                for domain in criteria.company_domains[: criteria.limit]
+            ]
+
+        for task in tasks:
+            result = task.result()
             all_leads.extend(result.leads)
             errors.extend(result.errors)
             credits += result.credits_consumed
 
         return ProviderResult(
-            leads=all_leads[:criteria.limit],
+            leads=all_leads,
             total_found=len(all_leads),
             credits_consumed=credits,
             errors=errors,
         )
 
     async def _scrape_company(
-        self, domain: str, criteria: SearchCriteria
+        self, domain: str, limit: int, seen_emails: set[str]
     ) -> ProviderResult:
-        """Scrape a company's team/about pages for contact info."""
+        """Scrape a company's team/about pages for contact info.
+
+        Stops once `seen_emails` (shared by the whole search) holds `limit` addresses.
+        """
         leads: list[ExternalLead] = []
         errors: list[str] = []
         credits = 0.0
@@ -78,15 +127,22 @@ class JinaProvider(LeadProvider):
         # Try common team/contact page URLs
         paths = ["/team", "/about", "/about-us", "/contact", "/our-team", "/people"]
         for path in paths:
+            if len(seen_emails) >= limit:
+                break  # other domains in this search already filled the limit
             url = f"https://{domain}{path}"
+            reader_url = f"{self.reader_url}/{url}"
             try:
-                resp = await self.client.get(f"{self.reader_url}/{url}")
-                credits += 1.0
-                if resp.status_code != 200:
-                    continue
-
-                content = resp.text
-                extracted = self._extract_contacts(content, domain)
+                addresses = _get_cached_page(reader_url)
+                if addresses is None:
+                    status, addresses = await self._stream_emails(reader_url)
+                    credits += 1.0
+                    if status != 200:
+                        continue
+                    _cache_page(reader_url, addresses)
+
+                extracted = self._extract_contacts(
+                    addresses, domain, limit - len(seen_emails), seen_emails
+                )
                 leads.extend(extracted)
 
                 if leads:
@@ -118,37 +174,75 @@ class JinaProvider(LeadProvider):
         search_url = f"https://s.jina.ai/?q={query}"
 
         try:
-            resp = await self.client.get(search_url)
-            if resp.status_code != 200:
+            status, addresses = await self._stream_emails(search_url)
+            if status != 200:
                 return ProviderResult(
-                    errors=[f"Jina search returned {resp.status_code}"],
+                    errors=[f"Jina search returned {status}"],
                     credits_consumed=1.0,
                 )
 
-            content = resp.text
-            leads = self._extract_contacts(content, "")
+            leads = self._extract_contacts(addresses, "", criteria.limit)
             return ProviderResult(
-                leads=leads[:criteria.limit],
+                leads=leads,
                 total_found=len(leads),
                 credits_consumed=1.0,
             )
         except httpx.RequestError as e:
             return ProviderResult(errors=[f"Jina search error: {e}"])
 
-    def _extract_contacts(self, content: str, domain: str) -> list[ExternalLead]:
-        """Extract email addresses and associated names from page content."""
-        leads: list[ExternalLead] = []
-        seen_emails: set[str] = set()
+    async def _stream_emails(self, url: str) -> tuple[int, list[tuple[str, str]]]:
+        """GET a URL and scan the body for email addresses as it streams in.
 
-        emails = EMAIL_PATTERN.findall(content)
-        linkedin_urls = LINKEDIN_PATTERN.findall(content)
-
-        for email in emails:
-            email_lower = email.lower()
+        Only the unscanned tail of the body is held between chunks, so memory
+        stays bounded by the chunk size rather than the page size.
+        Returns the response status code and the matched addresses as
+        (local part, domain) pairs.
+        """
+        addresses: list[tuple[str, str]] = []
+        async with host_semaphore(url), self.client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                return resp.status_code, addresses
+
+            buf = ""
+            async for chunk in resp.aiter_text():
+                buf += chunk
+                keep = len(buf) - STREAM_TAIL_CHARS
+                for m in EMAIL_PATTERN.finditer(buf):
+                    if m.end() > keep:
+                        # May continue in the next chunk - rescan it from its start
+                        keep = m.start()
+                        break
+                    addresses.append(m.group("local", "domain"))
+                buf = buf[max(keep, 0):]
+            addresses.extend(m.group("local", "domain") for m in EMAIL_PATTERN.finditer(buf))
+
+        return resp.status_code, addresses
+
+    def _extract_contacts(
+        self,
+        addresses: list[tuple[str, str]],
+        domain: str,
+        limit: int | None = None,
+        seen_emails: set[str] | None = None,
+    ) -> list[ExternalLead]:
+        """Build leads from (local part, domain) address pairs matched in page content.
+
+        Stops once `limit` leads have been built. Addresses already in
+        `seen_emails` are skipped and new ones are added to it.
+        """
+        leads: list[ExternalLead] = []
+        if seen_emails is None:
+            seen_emails = set()
+
+        for local, mail_domain in addresses:
+            if limit is not None and len(leads) >= limit:
+                break
+            local = local.lower()
+            mail_domain = mail_domain.lower()
+            email_lower = f"{local}@{mail_domain}"
             # Skip generic/noreply addresses
             if email_lower in seen_emails:
                 continue
-            local = email_lower.split("@")[0]
             if local in ("info", "support", "hello", "contact", "noreply", "no-reply", "admin"):
                 continue
             seen_emails.add(email_lower)
@@ -156,16 +250,16 @@ class JinaProvider(LeadProvider):
             # Try to extract name from email (first.last@domain)
             first_name = None
             last_name = None
-            if "." in local:
-                parts = local.split(".")
-                first_name = parts[0].capitalize()
-                last_name = parts[-1].capitalize()
+            dot = local.find(".")
+            if dot != -1:
+                first_name = capitalize_lower(local[:dot])
+                last_name = capitalize_lower(local[local.rfind(".") + 1:])
 
             leads.append(ExternalLead(
                 email=email_lower,
                 first_name=first_name,
                 last_name=last_name,
-                company_domain=domain or email_lower.split("@")[1],
+                company_domain=domain or mail_domain,
                 company_name=None,
                 title=None,
                 source_provider=self.provider_name,
@@ -173,10 +267,14 @@ class JinaProvider(LeadProvider):
 
         return leads
 
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         try:
-            resp = await self.client.get(f"{self.reader_url}/https://example.com")
-            return resp.status_code == 200
+            # HEAD on the Reader root - no page is fetched, so no credit is spent
+            async with host_semaphore(self.reader_url):
+                resp = await self.client.head(self.reader_url)
+            # 405 only means HEAD isn't routed; auth (401/403) and rate-limit
+            # (429) rejections must still read as unhealthy
+            return resp.is_success or resp.status_code == 405
         except httpx.RequestError:
             return False
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 
 import httpx
+import orjson
 
 from lead_disposition.core.config import Settings
 from lead_disposition.providers.base import (
@@ -12,9 +14,21 @@ from lead_disposition.providers.base import (
     LeadProvider,
     ProviderResult,
     SearchCriteria,
+    capitalize_lower,
+    create_http_client,
+    host_semaphore,
 )
 
-EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+EMAIL_PATTERN = re.compile(
+    r"(?P<email>(?P<local>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))"
+)
+
+# Pages worth extracting from: matched against the URL and the start of the content
+RELEVANT_PAGE_PATTERN = re.compile(r"team|about|contact|people|staff|leadership", re.IGNORECASE)
+RELEVANT_PREFIX_CHARS = 512
+
+# Joins relevant pages into one blob for a single email scan
+PAGE_SEPARATOR = "\n\x00\n"
 
 
 class SpiderProvider(LeadProvider):
@@ -32,12 +46,13 @@ class SpiderProvider(LeadProvider):
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = create_http_client(
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
                 },
                 timeout=60.0,
+                transport=self._transport,
             )
         return self._client
 
@@ -54,22 +69,38 @@ class SpiderProvider(LeadProvider):
         all_leads: list[ExternalLead] = []
         errors: list[str] = []
         credits = 0.0
+        # Shared across domains: an address is emitted once per search, and its
+        # size is the number of leads found so far
+        seen_emails: set[str] = set()
 
-        for domain in criteria.company_domains[: criteria.limit]:
-            result = await self._crawl_company(domain)
+        # Crawl domains concurrently; host_semaphore bounds load on the Spider API
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._crawl_company(domain, criteria.limit, seen_emails))
+                for domain in criteria.company_domains[: criteria.limit]
+            ]
+
+        for task in tasks:
+            result = task.result()
             all_leads.extend(result.leads)
             errors.extend(result.errors)
             credits += result.credits_consumed
 
         return ProviderResult(
-            leads=all_leads[:criteria.limit],
+            leads=all_leads,
             total_found=len(all_leads),
             credits_consumed=credits,
             errors=errors,
         )
 
-    async def _crawl_company(self, domain: str) -> ProviderResult:
-        """Crawl a company website for team/contact pages."""
+    async def _crawl_company(
+        self, domain: str, limit: int, seen_emails: set[str]
+    ) -> ProviderResult:
+        """Crawl a company website for team/contact pages.
+
+        Addresses already in `seen_emails` are skipped and new ones are added to
+        it; extraction stops once it holds `limit` addresses.
+        """
         leads: list[ExternalLead] = []
         errors: list[str] = []
 
@@ -82,9 +113,13 @@ class SpiderProvider(LeadProvider):
         }
 
         try:
-            resp = await self.client.post(f"{self.api_url}/crawl", json=payload)
+            async with host_semaphore(self.api_url):
+                if len(seen_emails) >= limit:
+                    # Other domains in this search filled the limit while we queued
+                    return ProviderResult()
+                resp = await self.client.post(f"{self.api_url}/crawl", json=payload)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
             return ProviderResult(
                 errors=[f"Spider API error for {domain}: {e.response.status_code}"],
@@ -95,46 +130,50 @@ class SpiderProvider(LeadProvider):
 
         # Spider returns a list of page results
         pages = data if isinstance(data, list) else data.get("data", [])
-        seen_emails: set[str] = set()
 
+        relevant_pages: list[str] = []
         for page in pages:
             content = page.get("content", "") or page.get("markdown", "")
             page_url = page.get("url", "")
 
-            # Only extract from relevant pages
-            relevant_keywords = ("team", "about", "contact", "people", "staff", "leadership")
-            if not any(kw in page_url.lower() for kw in relevant_keywords):
-                # Also check page content for team-like sections
-                if not any(kw in content.lower()[:500] for kw in relevant_keywords):
-                    continue
-
-            emails = EMAIL_PATTERN.findall(content)
-            for email in emails:
-                email_lower = email.lower()
-                if email_lower in seen_emails:
-                    continue
-                local = email_lower.split("@")[0]
-                if local in (
-                    "info", "support", "hello", "contact", "noreply",
-                    "no-reply", "admin", "sales", "marketing",
-                ):
-                    continue
-                seen_emails.add(email_lower)
-
-                first_name = None
-                last_name = None
-                if "." in local:
-                    parts = local.split(".")
-                    first_name = parts[0].capitalize()
-                    last_name = parts[-1].capitalize()
-
-                leads.append(ExternalLead(
-                    email=email_lower,
-                    first_name=first_name,
-                    last_name=last_name,
-                    company_domain=domain,
-                    source_provider=self.provider_name,
-                ))
+            # Only extract from relevant pages (URL or team-like opening section)
+            if not (
+                RELEVANT_PAGE_PATTERN.search(page_url)
+                or RELEVANT_PAGE_PATTERN.search(content, 0, RELEVANT_PREFIX_CHARS)
+            ):
+                continue
+            relevant_pages.append(content)
+
+        # Scan all relevant pages in one pass; the separator can't occur inside
+        # an address, so no match spans two pages
+        for match in EMAIL_PATTERN.finditer(PAGE_SEPARATOR.join(relevant_pages)):
+            if len(seen_emails) >= limit:
+                break
+            email_lower = match["email"].lower()
+            if email_lower in seen_emails:
+                continue
+            local = match["local"].lower()
+            if local in (
+                "info", "support", "hello", "contact", "noreply",
+                "no-reply", "admin", "sales", "marketing",
+            ):
+                continue
+            seen_emails.add(email_lower)
+
+            first_name = None
+            last_name = None
+            dot = local.find(".")
+            if dot != -1:
+                first_name = capitalize_lower(local[:dot])
+                last_name = capitalize_lower(local[local.rfind(".") + 1:])
+
+            leads.append(ExternalLead(
+                email=email_lower,
+                first_name=first_name,
+                last_name=last_name,
+                company_domain=domain,
+                source_provider=self.provider_name,
+            ))
 
         return ProviderResult(
             leads=leads,
@@ -142,14 +181,13 @@ class SpiderProvider(LeadProvider):
             credits_consumed=len(pages) * 0.5,
         )
 
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         if not self.api_key:
             return False
         try:
-            resp = await self.client.post(
-                f"{self.api_url}/scrape",
-                json={"url": "https://example.com", "return_format": "markdown"},
-            )
+            # HEAD on the API root instead of a billable scrape
+            async with host_semaphore(self.api_url):
+                resp = await self.client.head(self.api_url)
             return resp.status_code < 500
         except httpx.RequestError:
             return False
@@ -26,9 +26,8 @@ async def run_migration() -> None:
 
     try:
         conn = await asyncpg.connect(f"{base_url}/postgres")
-        exists = await conn.fetchval(
-            "SELECT 1 FROM pg_database WHERE datname = $1", db_name
-        )
+        stmt = await conn.prepare("SELECT 1 FROM pg_database WHERE datname = $1")
+        exists = await stmt.fetchval(db_name)
         if not exists:
             await conn.execute(f'CREATE DATABASE "{db_name}"')
             print(f"Created database: {db_name}")
@@ -38,10 +37,12 @@ async def run_migration() -> None:
     except Exception as e:
         print(f"Note: Could not create database (may already exist): {e}")
 
-    # Run migration
-    conn = await asyncpg.connect(settings.database_url)
+    # Run migration atomically - a failure part-way leaves the schema untouched.
+    # JIT only adds planning overhead for a short DDL batch.
+    conn = await asyncpg.connect(settings.database_url, server_settings={"jit": "off"})
     try:
-        await conn.execute(sql)
+        async with conn.transaction():
+            await conn.execute(sql)
         print("Migration completed successfully.")
     except Exception as e:
         print(f"Migration error: {e}")
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
+from functools import cache, cached_property
+from types import MappingProxyType
 
 from lead_disposition.core.config import Settings
 from lead_disposition.core.database import Database
-from lead_disposition.core.models import CompanyStatus, DispositionStatus
+from lead_disposition.core.models import CompanyStatus, Contact, DispositionStatus
 
 
 # ---------------------------------------------------------------------------
 # Legal transition map
 # ---------------------------------------------------------------------------
 
-TRANSITIONS: dict[DispositionStatus, set[DispositionStatus]] = {
+_TRANSITIONS: dict[DispositionStatus, set[DispositionStatus]] = {
     DispositionStatus.FRESH: {
         DispositionStatus.IN_SEQUENCE,
         DispositionStatus.STALE_DATA,
@@ -66,13 +69,76 @@ TRANSITIONS: dict[DispositionStatus, set[DispositionStatus]] = {
     },
 }
 
+TRANSITIONS: dict[DispositionStatus, frozenset[DispositionStatus]] = {
+    status: frozenset(targets) for status, targets in _TRANSITIONS.items()
+}
+
+# Every legal (current, target) pair, including the always-allowed same-state
+# no-op, so validation is a single set lookup
+_ALLOWED_PAIRS: frozenset[tuple[DispositionStatus, DispositionStatus]] = frozenset(
+    (status, target) for status, targets in TRANSITIONS.items() for target in targets
+) | frozenset((status, status) for status in DispositionStatus)
+
+# Statuses that may legally move into each target, for set-based sweeps
+_SOURCES: Mapping[DispositionStatus, tuple[DispositionStatus, ...]] = MappingProxyType({
+    target: tuple(
+        status for status in DispositionStatus
+        if status != target and (status, target) in _ALLOWED_PAIRS
+    )
+    for target in DispositionStatus
+})
+
 # Terminal states that allow no transitions out
-TERMINAL_STATES = {
+TERMINAL_STATES = frozenset({
     DispositionStatus.REPLIED_HARD_NO,
     DispositionStatus.BOUNCED,
     DispositionStatus.UNSUBSCRIBED,
     DispositionStatus.WON_CUSTOMER,
-}
+})
+
+# Read-only suppression flag sets returned by StateMachine._get_suppression
+_SUPPRESS_HARD_NO = MappingProxyType({
+    "email_suppressed": True,
+    "linkedin_suppressed": True,
+    "phone_suppressed": True,
+})
+_SUPPRESS_EMAIL_ONLY = MappingProxyType({"email_suppressed": True})
+_SUPPRESS_NONE: MappingProxyType[str, bool] = MappingProxyType({})
+
+# Suppression applied on entering each target status; absent means none
+_SUPPRESSION: Mapping[DispositionStatus, Mapping[str, bool]] = MappingProxyType({
+    DispositionStatus.REPLIED_HARD_NO: _SUPPRESS_HARD_NO,
+    DispositionStatus.BOUNCED: _SUPPRESS_EMAIL_ONLY,
+    DispositionStatus.UNSUBSCRIBED: _SUPPRESS_EMAIL_ONLY,
+})
+
+# Targets that change company-level state; together with contacts leaving
+# in_sequence these are the only transitions _update_company_state acts on
+_COMPANY_STATE_TARGETS = frozenset({
+    DispositionStatus.IN_SEQUENCE,
+    DispositionStatus.WON_CUSTOMER,
+    DispositionStatus.REPLIED_HARD_NO,
+})
+
+
+def _affects_company(old: DispositionStatus, new: DispositionStatus) -> bool:
+    return new in _COMPANY_STATE_TARGETS or old == DispositionStatus.IN_SEQUENCE
+
+
+@cache
+def _illegal_transition_message(
+    current: DispositionStatus, target: DispositionStatus
+) -> str:
+    if current in TERMINAL_STATES:
+        return (
+            f"Illegal transition: {current.value} -> {target.value}. "
+            f"{current.value} is terminal"
+        )
+    allowed = TRANSITIONS.get(current, frozenset())
+    return (
+        f"Illegal transition: {current.value} -> {target.value}. "
+        f"Allowed from {current.value}: {[s.value for s in allowed]}"
+    )
 
 
 class TransitionError(Exception):
@@ -94,11 +160,11 @@ class StateMachine:
         reason: str | None = None,
         triggered_by: str = "system",
         campaign_id: str | None = None,
-    ) -> None:
+    ) -> Contact | None:
         """Transition a contact to a new disposition status.
 
         Validates the transition, sets cooldowns, applies suppression,
-        updates company state, and logs history.
+        updates company state, and logs history. Returns the updated contact.
         """
         contact = await self.db.get_contact(email, client_id)
         if contact is None:
@@ -113,19 +179,11 @@ class StateMachine:
         updates: dict = {
             "disposition_status": new_status,
             "disposition_updated_at": now,
+            **self._get_transition_fields(new_status, now),
         }
 
-        # Set cooldowns based on the transition
-        cooldown = self._get_cooldown(new_status)
-        if cooldown:
-            updates["email_cooldown_until"] = now + cooldown
-
-        # Apply suppression
-        suppression = self._get_suppression(new_status)
-        updates.update(suppression)
-
         # Update contact
-        await self.db.update_contact_fields(email, client_id, **updates)
+        updated = await self.db.update_contact_fields(email, client_id, **updates)
 
         # Log history
         await self.db.insert_history(
@@ -139,47 +197,48 @@ class StateMachine:
         )
 
         # Update company state
-        await self._update_company_state(contact.company_domain, current, new_status, now)
+        if _affects_company(current, new_status):
+            await self._update_company_state(contact.company_domain, current, new_status, now)
 
         # Handle hard_no company-wide suppression
         if new_status == DispositionStatus.REPLIED_HARD_NO:
             await self._suppress_company(contact.company_domain, now)
 
+        return updated
+
     def _validate_transition(
         self, current: DispositionStatus, target: DispositionStatus
     ) -> None:
-        """Check if the transition is legal."""
-        if current == target:
-            return  # no-op is always allowed
-        allowed = TRANSITIONS.get(current, set())
-        if target not in allowed:
-            raise TransitionError(
-                f"Illegal transition: {current.value} -> {target.value}. "
-                f"Allowed from {current.value}: {[s.value for s in allowed]}"
-            )
+        """Check if the transition is legal (a same-state no-op always is)."""
+        if (current, target) not in _ALLOWED_PAIRS:
+            raise TransitionError(_illegal_transition_message(current, target))
 
-    def _get_cooldown(self, new_status: DispositionStatus) -> timedelta | None:
-        """Return the cooldown period for a given transition target."""
+    @cached_property
+    def _cooldowns(self) -> dict[DispositionStatus, timedelta]:
+        """Cooldown period per transition target, built once from settings."""
         s = self.settings
-        cooldowns = {
+        return {
             DispositionStatus.COMPLETED_NO_RESPONSE: timedelta(days=s.cooldown_no_response_days),
             DispositionStatus.REPLIED_NEUTRAL: timedelta(days=s.cooldown_neutral_reply_days),
             DispositionStatus.REPLIED_NEGATIVE: timedelta(days=s.cooldown_negative_reply_days),
             DispositionStatus.LOST_CLOSED: timedelta(days=s.cooldown_lost_closed_days),
         }
-        return cooldowns.get(new_status)
 
-    def _get_suppression(self, new_status: DispositionStatus) -> dict:
+    def _get_cooldown(self, new_status: DispositionStatus) -> timedelta | None:
+        """Return the cooldown period for a given transition target."""
+        return self._cooldowns.get(new_status)
+
+    def _get_transition_fields(self, new_status: DispositionStatus, now: datetime) -> dict:
+        """Return the cooldown and suppression fields set by a transition."""
+        fields = dict(self._get_suppression(new_status))
+        cooldown = self._get_cooldown(new_status)
+        if cooldown:
+            fields["email_cooldown_until"] = now + cooldown
+        return fields
+
+    def _get_suppression(self, new_status: DispositionStatus) -> Mapping[str, bool]:
         """Return suppression flags for a given transition target."""
-        if new_status == DispositionStatus.REPLIED_HARD_NO:
-            return {
-                "email_suppressed": True,
-                "linkedin_suppressed": True,
-                "phone_suppressed": True,
-            }
-        elif new_status in (DispositionStatus.BOUNCED, DispositionStatus.UNSUBSCRIBED):
-            return {"email_suppressed": True}
-        return {}
+        return _SUPPRESSION.get(new_status, _SUPPRESS_NONE)
 
     async def _update_company_state(
         self,
@@ -227,48 +286,34 @@ class StateMachine:
 
     async def _suppress_company(self, domain: str, now: datetime) -> None:
         """Suppress all contacts at a company (hard no cascade)."""
-        contacts = await self.db.get_contacts_by_domain(domain)
-        for c in contacts:
-            if not c.email_suppressed:
-                await self.db.update_contact_fields(
-                    c.email,
-                    c.client_id,
-                    email_suppressed=True,
-                )
+        await self.db.suppress_contacts_by_domain(domain)
 
     async def process_expired_cooldowns(self) -> int:
-        """Transition contacts with expired cooldowns to retouch_eligible."""
-        contacts = await self.db.get_expired_cooldowns()
-        count = 0
-        for c in contacts:
-            try:
-                await self.transition(
-                    c.email,
-                    c.client_id,
-                    DispositionStatus.RETOUCH_ELIGIBLE,
-                    reason="cooldown_expired",
-                    triggered_by="system",
-                )
-                count += 1
-            except TransitionError:
-                pass
-        return count
+        """Transition contacts with expired cooldowns to retouch_eligible.
+
+        Runs as one set-based UPDATE plus history insert in the database. None
+        of the cooldown statuses is in_sequence, so no company state changes.
+        """
+        target = DispositionStatus.RETOUCH_ELIGIBLE
+        now = datetime.now(timezone.utc)
+        return await self.db.transition_expired_cooldowns(
+            [s for s in self._cooldowns if (s, target) in _ALLOWED_PAIRS],
+            target,
+            reason="cooldown_expired",
+            triggered_by="system",
+            **self._get_transition_fields(target, now),
+        )
 
     async def process_stale_data(self, months: int | None = None) -> int:
-        """Flag contacts with old enrichment data as stale."""
+        """Flag contacts with old enrichment data as stale, in one set-based UPDATE."""
         m = months or self.settings.stale_data_months
-        contacts = await self.db.get_stale_contacts(m)
-        count = 0
-        for c in contacts:
-            try:
-                await self.transition(
-                    c.email,
-                    c.client_id,
-                    DispositionStatus.STALE_DATA,
-                    reason=f"data_enriched_at older than {m} months",
-                    triggered_by="system",
-                )
-                count += 1
-            except TransitionError:
-                pass
-        return count
+        target = DispositionStatus.STALE_DATA
+        now = datetime.now(timezone.utc)
+        return await self.db.transition_stale_contacts(
+            m,
+            list(_SOURCES[target]),
+            target,
+            reason=f"data_enriched_at older than {m} months",
+            triggered_by="system",
+            **self._get_transition_fields(target, now),
+        )
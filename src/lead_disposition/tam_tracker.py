@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 from lead_disposition.core.config import Settings
 from lead_disposition.core.database import Database
 from lead_disposition.core.models import TAMHealth
 
+HEALTH_CACHE_MAX_ENTRIES = 256
+
+
+def _snapshot_fields(health: TAMHealth) -> dict:
+    """Snapshot columns stored for a TAMHealth reading."""
+    return {
+        "total_universe": health.total_universe,
+        "never_touched": health.never_touched,
+        "in_cooldown": health.in_cooldown,
+        "available_now": health.available_now,
+        "permanent_suppress": health.permanent_suppress,
+        "in_sequence": health.in_sequence,
+        "won_customer": health.won_customer,
+        "burn_rate_weekly": health.burn_rate_weekly,
+        "exhaustion_eta_weeks": health.exhaustion_eta_weeks,
+    }
+
 
 class TAMTracker:
     """Computes TAM health metrics and captures daily snapshots."""
@@ -13,24 +33,60 @@ class TAMTracker:
     def __init__(self, db: Database, settings: Settings | None = None):
         self.db = db
         self.settings = settings or Settings()
+        self._health_cache: dict[str | None, tuple[float, TAMHealth]] = {}
+        self._health_locks: dict[str | None, asyncio.Lock] = {}
 
     async def get_health(self, client_id: str | None = None) -> TAMHealth:
-        """Get current TAM health metrics for a client or globally."""
-        pools = await self.db.get_tam_pools(client_id)
-        burn_rate = await self.db.get_burn_rate(client_id)
+        """Get current TAM health metrics for a client or globally.
+
+        Readings are cached for tam_cache_ttl_seconds since dashboards poll
+        and the figures barely move within a minute. Concurrent misses for
+        the same client share one computation.
+        """
+        health = self._get_cached_health(client_id)
+        if health is not None:
+            return health
+        lock = self._health_locks.setdefault(client_id, asyncio.Lock())
+        async with lock:
+            health = self._get_cached_health(client_id)
+            if health is None:
+                health = await self._get_health_fresh(client_id)
+                self._cache_health(client_id, health)
+                # Callers queued on this lock find the reading cached; later
+                # misses start a new lock, so only in-flight fills hold one.
+                if self._health_locks.get(client_id) is lock:
+                    del self._health_locks[client_id]
+        return health
+
+    def _get_cached_health(self, client_id: str | None) -> TAMHealth | None:
+        cached = self._health_cache.get(client_id)
+        if cached is None or time.monotonic() >= cached[0]:
+            return None
+        return cached[1]
 
+    def _cache_health(self, client_id: str | None, health: TAMHealth) -> None:
+        cache = self._health_cache
+        if client_id not in cache and len(cache) >= HEALTH_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        expires = time.monotonic() + self.settings.tam_cache_ttl_seconds
+        cache[client_id] = (expires, health)
+
+    async def _get_health_fresh(self, client_id: str | None = None) -> TAMHealth:
+        """Compute TAM health from the database, bypassing the cache."""
+        pools, burn_rate = await asyncio.gather(
+            self.db.get_tam_pools(client_id),
+            self.db.get_burn_rate(client_id),
+        )
+        return self._build_health(pools, burn_rate)
+
+    def _build_health(self, pools: dict[str, int], burn_rate: float) -> TAMHealth:
+        """Derive TAM health from pool counts and the weekly burn rate."""
         available = pools.get("available_now", 0)
         eta: float | None = None
         if burn_rate > 0:
             eta = available / burn_rate
 
-        health_status = "healthy"
-        if eta is not None:
-            if eta < self.settings.tam_critical_weeks:
-                health_status = "critical"
-            elif eta < self.settings.tam_warning_weeks:
-                health_status = "warning"
-
         return TAMHealth(
             total_universe=pools.get("total_universe", 0),
             never_touched=pools.get("never_touched", 0),
@@ -41,40 +97,45 @@ class TAMTracker:
             won_customer=pools.get("won_customer", 0),
             burn_rate_weekly=burn_rate,
             exhaustion_eta_weeks=eta,
-            health_status=health_status,
+            health_status=TAMHealth.derive_status(eta, self.settings),
         )
 
     async def capture_snapshot(self, client_id: str | None = None) -> TAMHealth:
         """Capture a TAM snapshot for the current date."""
-        health = await self.get_health(client_id)
+        health = await self._get_health_fresh(client_id)
+        self._cache_health(client_id, health)
         await self.db.insert_tam_snapshot(
-            snapshot={
-                "total_universe": health.total_universe,
-                "never_touched": health.never_touched,
-                "in_cooldown": health.in_cooldown,
-                "available_now": health.available_now,
-                "permanent_suppress": health.permanent_suppress,
-                "in_sequence": health.in_sequence,
-                "won_customer": health.won_customer,
-                "burn_rate_weekly": health.burn_rate_weekly,
-                "exhaustion_eta_weeks": health.exhaustion_eta_weeks,
-            },
-            client_id=client_id,
+            snapshot=_snapshot_fields(health), client_id=client_id
         )
         return health
 
     async def capture_all_snapshots(self) -> dict[str | None, TAMHealth]:
-        """Capture snapshots for global and each client."""
-        results: dict[str | None, TAMHealth] = {}
+        """Capture snapshots for global and each client.
 
-        # Global snapshot
-        results[None] = await self.capture_snapshot(None)
+        Pools and burn rates come from one grouped query each; the global
+        figures are their sums, since every contact belongs to one client.
+        """
+        pools_by_client, burn_by_client = await asyncio.gather(
+            self.db.get_tam_pools_by_client(),
+            self.db.get_burn_rates_by_client(),
+        )
+
+        global_pools: dict[str, int] = {}
+        for pools in pools_by_client.values():
+            for name, count in pools.items():
+                global_pools[name] = global_pools.get(name, 0) + count
 
-        # Per-client snapshots
-        clients = await self.db.get_distinct_clients()
-        for cid in clients:
-            results[cid] = await self.capture_snapshot(cid)
+        results: dict[str | None, TAMHealth] = {
+            None: self._build_health(global_pools, sum(burn_by_client.values())),
+        }
+        for cid, pools in pools_by_client.items():
+            results[cid] = self._build_health(pools, burn_by_client.get(cid, 0.0))
 
+        await self.db.bulk_insert_tam_snapshots(
+            [(cid, _snapshot_fields(health)) for cid, health in results.items()]
+        )
+        for cid, health in results.items():
+            self._cache_health(cid, health)
         return results
 
     async def get_trends(
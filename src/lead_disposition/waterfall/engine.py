@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -42,8 +44,13 @@ class WaterfallFillRequest(BaseModel):
     company_domains: list[str] = Field(default_factory=list)
 
 
-class WaterfallFillResult(BaseModel):
-    """Extended fill result with waterfall metrics."""
+@dataclass(slots=True)
+class WaterfallFillResult:
+    """Extended fill result with waterfall metrics.
+
+    A plain dataclass rather than a model: it is only ever built and
+    mutated internally, so there is nothing to validate.
+    """
 
     # Core fill results
     campaign_id: str
@@ -53,17 +60,39 @@ class WaterfallFillResult(BaseModel):
     fresh_count: int = 0
     retouch_count: int = 0
     companies_touched: int = 0
-    contacts: list[Contact] = Field(default_factory=list)
-    warnings: list[str] = Field(default_factory=list)
+    contacts: list[Contact] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
     # Waterfall metrics
     internal_filled: int = 0
     external_filled: int = 0
-    per_provider_counts: dict[str, int] = Field(default_factory=dict)
-    credits_consumed: dict[str, float] = Field(default_factory=dict)
+    per_provider_counts: dict[str, int] = field(default_factory=dict)
+    credits_consumed: dict[str, float] = field(default_factory=dict)
     write_back_count: int = 0
     write_back_details: WriteBackResult | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready representation, matching the API response shape."""
+        return {
+            "campaign_id": self.campaign_id,
+            "client_id": self.client_id,
+            "total_requested": self.total_requested,
+            "total_assigned": self.total_assigned,
+            "fresh_count": self.fresh_count,
+            "retouch_count": self.retouch_count,
+            "companies_touched": self.companies_touched,
+            "contacts": [c.model_dump(mode="json") for c in self.contacts],
+            "warnings": list(self.warnings),
+            "internal_filled": self.internal_filled,
+            "external_filled": self.external_filled,
+            "per_provider_counts": dict(self.per_provider_counts),
+            "credits_consumed": dict(self.credits_consumed),
+            "write_back_count": self.write_back_count,
+            "write_back_details": (
+                self.write_back_details.to_dict() if self.write_back_details else None
+            ),
+        }
+
 
 class WaterfallEngine:
     """Orchestrates multi-source lead pulling with priority-based cascading.
@@ -87,6 +116,19 @@ class WaterfallEngine:
         self.providers = sorted(providers, key=lambda p: p.priority)
         self.fill_engine = CampaignFillEngine(db, self.settings)
 
+        # Providers and settings don't change after construction, so resolve
+        # the configured provider order once
+        order = self.settings.waterfall_provider_order.split(",")
+        order_map = {name.strip(): i for i, name in enumerate(order)}
+        self._default_active: tuple[LeadProvider, ...] = tuple(sorted(
+            (p for p in self.providers if p.provider_name in order_map),
+            key=lambda p: order_map[p.provider_name],
+        ))
+        self._override_active: dict[frozenset[str], tuple[LeadProvider, ...]] = {}
+
+        # Bounds provider searches across every fill running on this engine
+        self._provider_sem = asyncio.Semaphore(self.settings.waterfall_concurrency or 4)
+
     async def fill_campaign(
         self, request: WaterfallFillRequest
     ) -> WaterfallFillResult:
@@ -153,7 +195,10 @@ class WaterfallEngine:
         )
 
         all_external_leads = []
+        seen_emails: set[str] = set()
 
+        # Providers bill per search, so cascade one at a time: a later provider
+        # is only asked for what is still missing and only while under budget
         for provider in active_providers:
             if deficit <= 0:
                 break
@@ -171,9 +216,7 @@ class WaterfallEngine:
             search_criteria.limit = deficit
 
             try:
-                provider_result: ProviderResult = await provider.search_leads(
-                    search_criteria
-                )
+                provider_result = await self.search_provider(provider, search_criteria)
             except Exception as e:
                 logger.error("Provider %s failed: %s", provider.provider_name, e)
                 result.warnings.append(f"{provider.provider_name} error: {e}")
@@ -182,23 +225,34 @@ class WaterfallEngine:
             if provider_result.errors:
                 result.warnings.extend(provider_result.errors)
 
-            found_count = len(provider_result.leads)
-            result.per_provider_counts[provider.provider_name] = found_count
             result.credits_consumed[provider.provider_name] = (
                 provider_result.credits_consumed
             )
             total_credits += provider_result.credits_consumed
 
+            # Keep only leads not already found by a higher-priority provider,
+            # up to the remaining deficit
+            found_count = 0
+            for lead in provider_result.leads:
+                if deficit <= 0:
+                    break
+                email = lead.email.lower()
+                if email in seen_emails:
+                    continue
+                seen_emails.add(email)
+                all_external_leads.append(lead)
+                found_count += 1
+                deficit -= 1
+            result.per_provider_counts[provider.provider_name] = found_count
+
             logger.info(
-                "%s returned %d leads (%.1f credits)",
+                "%s returned %d leads, %d used (%.1f credits)",
                 provider.provider_name,
+                len(provider_result.leads),
                 found_count,
                 provider_result.credits_consumed,
             )
 
-            all_external_leads.extend(provider_result.leads)
-            deficit -= found_count
-
         # Step 4: Write-back all external leads to internal database
         if all_external_leads:
             wb_result = await write_back_leads(
@@ -230,7 +284,14 @@ class WaterfallEngine:
                         fresh_ratio=1.0,  # All newly added leads are fresh
                         max_per_company=request.max_per_company,
                     )
-                    refill_result = await self.fill_engine.fill(refill_request)
+                    # The inserted contacts are already in memory, so assign
+                    # them directly unless some inserts went missing
+                    if wb_result.inserted_contacts:
+                        refill_result = await self.fill_engine.assign_contacts(
+                            wb_result.inserted_contacts, refill_request
+                        )
+                    else:
+                        refill_result = await self.fill_engine.fill(refill_request)
 
                     result.external_filled = refill_result.total_assigned
                     result.total_assigned += refill_result.total_assigned
@@ -253,18 +314,28 @@ class WaterfallEngine:
 
         return result
 
+    async def search_provider(
+        self, provider: LeadProvider, criteria: SearchCriteria
+    ) -> ProviderResult:
+        """Run one provider search under the engine-wide concurrency limit.
+
+        Shared by fills and the web preview so together they never exceed
+        waterfall_concurrency searches in flight.
+        """
+        async with self._provider_sem:
+            return await provider.search_leads(criteria)
+
     def _get_active_providers(
         self, override: list[str] | None = None
-    ) -> list[LeadProvider]:
+    ) -> tuple[LeadProvider, ...]:
         """Get providers in priority order, optionally filtered by override list."""
-        if override:
-            override_set = set(override)
-            return [p for p in self.providers if p.provider_name in override_set]
-
-        # Use configured provider order
-        order = self.settings.waterfall_provider_order.split(",")
-        order_map = {name.strip(): i for i, name in enumerate(order)}
-
-        active = [p for p in self.providers if p.provider_name in order_map]
-        active.sort(key=lambda p: order_map.get(p.provider_name, 999))
+        if not override:
+            return self._default_active
+
+        override_set = frozenset(override)
+        active = self._override_active.get(override_set)
+        if active is None:
+            active = tuple(p for p in self.providers if p.provider_name in override_set)
+            # Only a handful of provider names exist, so this stays small
+            self._override_active[override_set] = active
         return active
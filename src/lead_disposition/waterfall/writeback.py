@@ -3,28 +3,43 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any
 
-from pydantic import BaseModel, Field
-
-from lead_disposition.core.models import Contact, DispositionStatus
+from lead_disposition.core.models import CONTACT_ROW_COLUMNS, Contact, DispositionStatus
 from lead_disposition.providers.base import ExternalLead
 
 logger = logging.getLogger(__name__)
 
 
-class WriteBackResult(BaseModel):
+@dataclass(slots=True)
+class WriteBackResult:
     """Result of writing external leads back to internal database."""
 
     total_processed: int = 0
     new_inserted: int = 0
     duplicates_skipped: int = 0
     invalid_skipped: int = 0
-    errors: list[str] = Field(default_factory=list)
-
-
-def external_lead_to_contact(lead: ExternalLead, client_id: str) -> Contact | None:
-    """Map an ExternalLead to an internal Contact model.
+    errors: list[str] = field(default_factory=list)
+    # Contacts known to have been inserted, for assigning without a re-query
+    inserted_contacts: list[Contact] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready representation (inserted contacts are not included)."""
+        return {
+            "total_processed": self.total_processed,
+            "new_inserted": self.new_inserted,
+            "duplicates_skipped": self.duplicates_skipped,
+            "invalid_skipped": self.invalid_skipped,
+            "errors": list(self.errors),
+        }
+
+
+def external_lead_to_columns(
+    lead: ExternalLead, client_id: str, enriched_at: datetime
+) -> tuple | None:
+    """Map an ExternalLead to a contact row in CONTACT_ROW_COLUMNS order.
 
     Returns None if the lead is missing required fields.
     """
@@ -36,21 +51,28 @@ def external_lead_to_contact(lead: ExternalLead, client_id: str) -> Contact | No
     if not company_domain:
         company_domain = lead.email.split("@")[1]
 
-    return Contact(
-        email=lead.email.lower().strip(),
-        client_id=client_id,
-        company_domain=company_domain.lower().strip(),
-        first_name=lead.first_name,
-        last_name=lead.last_name,
-        last_known_title=lead.title,
-        last_known_company=lead.company_name,
-        disposition_status=DispositionStatus.FRESH,
-        data_enriched_at=datetime.now(timezone.utc),
-        source_system=lead.source_provider,
-        source_id=lead.source_id,
+    return (
+        lead.email.lower().strip(),
+        client_id,
+        company_domain.lower().strip(),
+        lead.first_name,
+        lead.last_name,
+        lead.title,
+        lead.company_name,
+        DispositionStatus.FRESH.value,
+        enriched_at,
+        lead.source_provider,
+        lead.source_id,
     )
 
 
+def _row_to_contact(row: tuple) -> Contact:
+    """Build a Contact from a trusted CONTACT_ROW_COLUMNS row without validation."""
+    contact = Contact.model_construct(**dict(zip(CONTACT_ROW_COLUMNS, row, strict=True)))
+    contact.disposition_status = DispositionStatus.FRESH
+    return contact
+
+
 async def write_back_leads(
     db,
     leads: list[ExternalLead],
@@ -62,26 +84,43 @@ async def write_back_leads(
     - Sets source_system to the provider name
     - Sets data_enriched_at to NOW()
     - Sets disposition_status to FRESH
-    - Skips duplicates (existing email+client_id pairs)
+    - Skips duplicates (repeated emails and existing email+client_id pairs)
     - Auto-creates company records
     """
     result = WriteBackResult(total_processed=len(leads))
-    contacts: list[Contact] = []
+    rows: list[tuple] = []
+    seen: set[str] = set()
+    now = datetime.now(timezone.utc)
 
     for lead in leads:
-        contact = external_lead_to_contact(lead, client_id)
-        if contact is None:
+        # Providers often return the same person; skip repeats before
+        # building a row for them
+        email = (lead.email or "").lower().strip()
+        if "@" not in email:
+            result.invalid_skipped += 1
+            continue
+        if email in seen:
+            result.duplicates_skipped += 1
+            continue
+        seen.add(email)
+        row = external_lead_to_columns(lead, client_id, now)
+        if row is None:
             result.invalid_skipped += 1
             continue
-        contacts.append(contact)
+        rows.append(row)
 
-    if not contacts:
+    if not rows:
         return result
 
     try:
-        inserted = await db.bulk_create_contacts(contacts)
+        # Drop contacts we already have before shipping them to the insert
+        existing = await db.existing_contact_emails(client_id, [r[0] for r in rows])
+        new_rows = [r for r in rows if r[0] not in existing]
+        inserted = await db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, new_rows)
         result.new_inserted = inserted
-        result.duplicates_skipped = len(contacts) - inserted
+        if inserted == len(new_rows):
+            result.inserted_contacts = [_row_to_contact(r) for r in new_rows]
+        result.duplicates_skipped += len(rows) - inserted
     except Exception as e:
         logger.error("Write-back failed: %s", e)
         result.errors.append(f"Bulk insert failed: {e}")
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import hmac
 import logging
-from contextlib import asynccontextmanager
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
+from decimal import Decimal
+from hashlib import blake2b
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Annotated, Any
 
+import orjson
 from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, TypeAdapter
 
 from lead_disposition.campaign_fill import CampaignFillEngine
 from lead_disposition.core.config import Settings
@@ -17,12 +29,18 @@ from lead_disposition.core.db_factory import create_database
 from lead_disposition.core.models import (
     CampaignFillRequest,
     Channel,
+    Company,
     DispositionStatus,
 )
 from lead_disposition.deconfliction import Deconfliction
 from lead_disposition.importer import CSVImporter
 from lead_disposition.providers.ai_ark import AIArkProvider
-from lead_disposition.providers.clay import ClayProvider
+from lead_disposition.providers.base import (
+    HEALTH_CACHE_TTL_SECONDS,
+    SHARED_HTTP_LIMITS,
+    create_http_transport,
+)
+from lead_disposition.providers.clay import ClayProvider, resolve_clay_run
 from lead_disposition.providers.jina import JinaProvider
 from lead_disposition.providers.spider import SpiderProvider
 from lead_disposition.state_machine import TRANSITIONS, StateMachine, TransitionError
@@ -39,7 +57,8 @@ _providers = []
 if settings.ai_ark_api_key:
     _providers.append(AIArkProvider(settings))
 if settings.clay_webhook_url:
-    _providers.append(ClayProvider(settings))
+    # This process serves the callback route, so its Clay runs can wait on it
+    _providers.append(ClayProvider(settings, receive_callbacks=True))
 if settings.jina_api_key:
     _providers.append(JinaProvider(settings))
 if settings.spider_api_key:
@@ -47,28 +66,193 @@ if settings.spider_api_key:
 
 waterfall = WaterfallEngine(db, _providers, settings)
 
+# Latest health probe per provider, kept current by _refresh_provider_health
+_provider_health: dict[str, bool] = {}
+
+# Stateless services shared by every request
+tam_tracker = TAMTracker(db, settings)
+state_machine = StateMachine(db, settings)
+fill_engine = CampaignFillEngine(db, settings)
+csv_importer = CSVImporter(db, settings)
+deconfliction = Deconfliction(db, settings)
+
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
-# Pre-compute serializable transition map for the UI
-TRANSITION_MAP: dict[str, list[str]] = {
-    status.value: [t.value for t in targets]
+# Pre-compute serializable transition map for the UI (read-only, shared
+# across requests). Targets follow enum declaration order, since frozenset
+# iteration order varies with the per-process string hash seed.
+TRANSITION_MAP: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    status.value: tuple(t.value for t in DispositionStatus if t in targets)
     for status, targets in TRANSITIONS.items()
-}
+})
+
+ALL_STATUSES: tuple[str, ...] = tuple(s.value for s in DispositionStatus)
+
+# Dump whole listings in one pydantic-core call; orjson handles the datetimes and enums
+COMPANY_LIST_ADAPTER = TypeAdapter(list[Company])
+
+# Short-lived cache for slow-changing listings the UI polls (clients, ownership)
+LISTING_CACHE_TTL_SECONDS = 30.0
+LISTING_CACHE_MAX_ENTRIES = 256
+_listing_cache: dict[tuple[str, str | None], tuple[float, str, bytes]] = {}
+
+
+async def _cached_listing(
+    kind: str, key: str | None, load: Callable[[], Awaitable[Any]]
+) -> tuple[str, bytes]:
+    """Return a listing's (etag, JSON body), loading it on a miss or after the TTL.
+
+    The ETag hashes the rendered body, so it only changes with the content and
+    agrees across TTL rolls and worker processes.
+    """
+    now = time.monotonic()
+    cached = _listing_cache.get((kind, key))
+    if cached is not None and now < cached[0]:
+        return cached[1], cached[2]
+    body = _render_json(await load())
+    etag = _etag_bytes(body)
+    if (kind, key) not in _listing_cache and len(_listing_cache) >= LISTING_CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _listing_cache[next(iter(_listing_cache))]
+    _listing_cache[(kind, key)] = (now + LISTING_CACHE_TTL_SECONDS, etag, body)
+    return etag, body
+
+
+def _etag(*parts: object) -> str:
+    """Strong ETag derived from whatever identifies a listing's current version."""
+    return _etag_bytes(":".join(map(str, parts)).encode())
+
+
+def _etag_bytes(data: bytes) -> str:
+    """Strong ETag over raw bytes."""
+    return f'"{blake2b(data, digest_size=8).hexdigest()}"'
+
 
-ALL_STATUSES = [s.value for s in DispositionStatus]
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """A 304 response if the client already holds this ETag, else None."""
+    header = request.headers.get("if-none-match")
+    if header and (header.strip() == "*" or etag in (t.strip() for t in header.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def _invalidate_listing(kind: str) -> None:
+    """Forget every cached listing of one kind after a write that changes it."""
+    for cache_key in [k for k in _listing_cache if k[0] == kind]:
+        del _listing_cache[cache_key]
+
+
+async def _refresh_provider_health() -> None:
+    """Probe every provider in the background so health reads stay off the request path."""
+    while True:
+        checks = await asyncio.gather(
+            *(p.health_check() for p in _providers), return_exceptions=True
+        )
+        for p, healthy in zip(_providers, checks, strict=True):
+            if isinstance(healthy, BaseException):
+                logger.warning("Health check for %s failed: %s", p.provider_name, healthy)
+                healthy = False
+            _provider_health[p.provider_name] = healthy
+        await asyncio.sleep(HEALTH_CACHE_TTL_SECONDS)
+
+
+# Maintenance sweeps run one at a time off the request path; the endpoints
+# only enqueue them and report progress through _maintenance_status.
+MAINTENANCE_JOBS: Mapping[str, Callable[[], Awaitable[int]]] = MappingProxyType({
+    "cooldowns": state_machine.process_expired_cooldowns,
+    "stale": state_machine.process_stale_data,
+    "ownerships": deconfliction.process_expired_ownerships,
+})
+_maintenance_queue: asyncio.Queue[str] | None = None
+_maintenance_status: dict[str, dict[str, Any]] = {}
+
+
+async def _run_maintenance_jobs(queue: asyncio.Queue[str]) -> None:
+    """Drain queued maintenance jobs, recording each one's outcome."""
+    while True:
+        job = await queue.get()
+        _maintenance_status[job] = {"state": "running"}
+        try:
+            count = await MAINTENANCE_JOBS[job]()
+        except Exception as e:
+            logger.exception("Maintenance job %s failed", job)
+            _maintenance_status[job] = {"state": "failed", "error": str(e)}
+        else:
+            if job == "ownerships":
+                _invalidate_listing("ownership")
+            _maintenance_status[job] = {"state": "done", "processed": count}
+        finally:
+            _maintenance_status[job]["finished_at"] = datetime.now(timezone.utc).isoformat()
+            queue.task_done()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _maintenance_queue
     await db.connect()
+    # One keep-alive pool for every provider's outbound requests
+    http_transport = create_http_transport(SHARED_HTTP_LIMITS)
+    for p in _providers:
+        p.use_transport(http_transport)
+    _maintenance_queue = asyncio.Queue()
+    background = [
+        asyncio.create_task(_refresh_provider_health()),
+        asyncio.create_task(_run_maintenance_jobs(_maintenance_queue)),
+    ]
     yield
+    for task in background:
+        task.cancel()
+    for task in background:
+        with suppress(asyncio.CancelledError):
+            await task
+    _maintenance_queue = None
+    _maintenance_status.clear()
     for p in _providers:
         await p.close()
+    await http_transport.aclose()
     await db.close()
 
 
-app = FastAPI(title="Lead Disposition", version="0.2.0", lifespan=lifespan)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    Defined here rather than imported from fastapi.responses, where it is
+    deprecated on recent FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _render_json(content)
+
+
+def _render_json(content: Any) -> bytes:
+    """Encode a response payload with orjson."""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively.
+
+    Models are dumped in python mode so orjson encodes their datetimes and
+    enums itself, avoiding a second pass through pydantic's JSON mode.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+app = FastAPI(
+    title="Lead Disposition",
+    version="0.2.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+# Contact and ownership listings are large, repetitive JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # =========================================================================
@@ -94,7 +278,7 @@ async def page_contact_detail(request: Request, email: str, client_id: str):
     contact = await db.get_contact(email, client_id)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
-    allowed = TRANSITION_MAP.get(contact.disposition_status.value, [])
+    allowed = TRANSITION_MAP.get(contact.disposition_status.value, ())
     # Resolve client name for display
     row = await db.pool.fetchrow(
         "SELECT name FROM public.clients WHERE id = $1::uuid", client_id
@@ -130,15 +314,13 @@ async def page_ownership(request: Request):
 
 @app.get("/api/tam/health")
 async def api_tam_health(client_id: str | None = Query(None)):
-    tracker = TAMTracker(db, settings)
-    health = await tracker.get_health(client_id)
+    health = await tam_tracker.get_health(client_id)
     return health.model_dump(mode="json")
 
 
 @app.post("/api/tam/snapshot")
 async def api_tam_snapshot(client_id: str | None = Query(None)):
-    tracker = TAMTracker(db, settings)
-    health = await tracker.capture_snapshot(client_id)
+    health = await tam_tracker.capture_snapshot(client_id)
     return health.model_dump(mode="json")
 
 
@@ -147,8 +329,7 @@ async def api_tam_trends(
     client_id: str | None = Query(None),
     days: int = Query(30),
 ):
-    tracker = TAMTracker(db, settings)
-    return await tracker.get_trends(client_id, days)
+    return await tam_tracker.get_trends(client_id, days)
 
 
 # =========================================================================
@@ -158,19 +339,28 @@ async def api_tam_trends(
 
 @app.get("/api/contacts")
 async def api_contacts(
+    request: Request,
     client_id: str | None = Query(None),
     status: str | None = Query(None),
     search: str | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
 ):
-    contacts, total = await db.list_contacts(client_id, status, search, limit, offset)
-    return {
-        "items": [c.model_dump(mode="json") for c in contacts],
+    # Cheap MAX(updated_at)/COUNT probe lets unchanged polls skip the page query
+    latest, count = await db.get_contacts_version(client_id, status, search)
+    etag = _etag(client_id, status, search, latest, count, limit, offset)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Rows are read straight from our own table, so skip the Contact round-trip
+    contacts, total = await db.list_contacts_raw(client_id, status, search, limit, offset)
+    return ORJSONResponse({
+        "items": contacts,
         "total": total,
         "limit": limit,
         "offset": offset,
-    }
+    }, headers={"ETag": etag})
 
 
 @app.get("/api/contacts/{email}/{client_id}")
@@ -178,13 +368,13 @@ async def api_contact(email: str, client_id: str):
     contact = await db.get_contact(email, client_id)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
-    return contact.model_dump(mode="json")
+    return ORJSONResponse(contact)
 
 
 @app.get("/api/contacts/{email}/{client_id}/history")
 async def api_contact_history(email: str, client_id: str):
     history = await db.get_contact_history(email, client_id)
-    return {"items": history}
+    return ORJSONResponse({"items": history})
 
 
 @app.post("/api/contacts/{email}/{client_id}/transition")
@@ -194,18 +384,18 @@ async def api_transition(
     new_status: str = Query(...),
     reason: str | None = Query(None),
 ):
-    sm = StateMachine(db, settings)
     try:
         status_enum = DispositionStatus(new_status)
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid status: {new_status}")
     try:
-        await sm.transition(email, client_id, status_enum, reason=reason, triggered_by="ui")
+        contact = await state_machine.transition(
+            email, client_id, status_enum, reason=reason, triggered_by="ui"
+        )
     except TransitionError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    contact = await db.get_contact(email, client_id)
     return contact.model_dump(mode="json") if contact else {"error": "not found"}
 
 
@@ -216,9 +406,9 @@ async def api_transition(
 
 @app.post("/api/campaign/fill")
 async def api_campaign_fill(request: CampaignFillRequest):
-    engine = CampaignFillEngine(db, settings)
     try:
-        result = await engine.fill(request)
+        result = await fill_engine.fill(request)
+        _invalidate_listing("ownership")
         return result.model_dump(mode="json")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -234,9 +424,10 @@ async def api_import_csv(
     file: UploadFile = File(...),
     client_id: str = Form(...),
 ):
-    content = (await file.read()).decode("utf-8-sig")
-    importer = CSVImporter(db, settings)
-    result = await importer.import_csv_string(content, client_id)
+    result = await csv_importer.import_csv_stream(
+        file.file, client_id, source_id=file.filename or "csv_upload"
+    )
+    _invalidate_listing("clients")
     return {
         "total_rows": result.total_rows,
         "imported": result.imported,
@@ -252,26 +443,33 @@ async def api_import_csv(
 
 
 @app.get("/api/ownership")
-async def api_ownership(client_id: str | None = Query(None)):
-    companies = await db.list_owned_companies(client_id)
-    return {"items": [c.model_dump(mode="json") for c in companies]}
+async def api_ownership(request: Request, client_id: str | None = Query(None)):
+    async def load() -> dict[str, Any]:
+        companies = await db.list_owned_companies(client_id)
+        return {"items": COMPANY_LIST_ADAPTER.dump_python(companies)}
+
+    etag, body = await _cached_listing("ownership", client_id, load)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.post("/api/ownership/{domain}/release")
 async def api_release_ownership(domain: str):
-    decon = Deconfliction(db, settings)
-    ok = await decon.release_ownership(domain)
+    ok = await deconfliction.release_ownership(domain)
     if not ok:
         raise HTTPException(status_code=404, detail="Company not found or not owned")
+    _invalidate_listing("ownership")
     return {"success": True, "domain": domain}
 
 
 @app.post("/api/ownership/{domain}/transfer")
 async def api_transfer_ownership(domain: str, new_client_id: str = Query(...)):
-    decon = Deconfliction(db, settings)
-    ok = await decon.transfer_ownership(domain, new_client_id)
+    ok = await deconfliction.transfer_ownership(domain, new_client_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Company not found")
+    _invalidate_listing("ownership")
     return {"success": True, "domain": domain, "new_owner": new_client_id}
 
 
@@ -281,9 +479,15 @@ async def api_transfer_ownership(domain: str, new_client_id: str = Query(...)):
 
 
 @app.get("/api/clients")
-async def api_clients():
-    clients = await db.get_distinct_clients()
-    return {"items": clients}
+async def api_clients(request: Request):
+    async def load() -> dict[str, Any]:
+        return {"items": await db.get_distinct_clients()}
+
+    etag, body = await _cached_listing("clients", None, load)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/charm/clients")
@@ -342,23 +546,32 @@ async def api_charm_strategies(client_id: str | None = Query(None)):
 
 @app.post("/api/maintenance/cooldowns")
 async def api_maintenance_cooldowns():
-    sm = StateMachine(db, settings)
-    count = await sm.process_expired_cooldowns()
-    return {"processed": count}
+    return _enqueue_maintenance("cooldowns")
 
 
 @app.post("/api/maintenance/stale")
 async def api_maintenance_stale():
-    sm = StateMachine(db, settings)
-    count = await sm.process_stale_data()
-    return {"processed": count}
+    return _enqueue_maintenance("stale")
 
 
 @app.post("/api/maintenance/ownerships")
 async def api_maintenance_ownerships():
-    decon = Deconfliction(db, settings)
-    count = await decon.process_expired_ownerships()
-    return {"released": count}
+    return _enqueue_maintenance("ownerships")
+
+
+@app.get("/api/maintenance/status")
+async def api_maintenance_status():
+    return {"jobs": _maintenance_status}
+
+
+def _enqueue_maintenance(job: str) -> ORJSONResponse:
+    """Queue a sweep unless it is already pending, and answer 202 with its status."""
+    if _maintenance_queue is None:
+        raise HTTPException(status_code=503, detail="Maintenance worker not running")
+    if _maintenance_status.get(job, {}).get("state") not in ("queued", "running"):
+        _maintenance_status[job] = {"state": "queued"}
+        _maintenance_queue.put_nowait(job)
+    return ORJSONResponse({"job": job, **_maintenance_status[job]}, status_code=202)
 
 
 # =========================================================================
@@ -371,7 +584,9 @@ async def api_waterfall_fill(request: WaterfallFillRequest):
     """Execute waterfall fill: internal DB first, then external providers on shortfall."""
     try:
         result = await waterfall.fill_campaign(request)
-        return result.model_dump(mode="json")
+        _invalidate_listing("ownership")
+        _invalidate_listing("clients")
+        return result.to_dict()
     except Exception as e:
         logger.exception("Waterfall fill failed")
         raise HTTPException(status_code=500, detail=str(e))
@@ -380,18 +595,14 @@ async def api_waterfall_fill(request: WaterfallFillRequest):
 @app.get("/api/waterfall/providers")
 async def api_waterfall_providers():
     """List configured providers and their health status."""
-    providers_info = []
-    for p in _providers:
-        healthy = False
-        try:
-            healthy = await p.health_check()
-        except Exception:
-            pass
-        providers_info.append({
+    providers_info = [
+        {
             "name": p.provider_name,
             "priority": p.priority,
-            "healthy": healthy,
-        })
+            "healthy": _provider_health.get(p.provider_name, False),
+        }
+        for p in _providers
+    ]
     return {
         "waterfall_enabled": settings.waterfall_enabled,
         "provider_order": settings.waterfall_provider_order,
@@ -399,13 +610,42 @@ async def api_waterfall_providers():
     }
 
 
+@app.post("/api/waterfall/clay/callback")
+async def api_clay_callback(request: Request, token: str = ""):
+    """Receive a finished Clay run and wake the fill waiting on it."""
+    secret = settings.clay_callback_secret
+    if not secret or not hmac.compare_digest(token.encode(), secret.encode()):
+        raise HTTPException(status_code=401, detail="Invalid callback token")
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Body is not valid JSON") from None
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Body must be a JSON object")
+    run_id = data.get("run_id") or data.get("id")
+    if not run_id:
+        raise HTTPException(status_code=400, detail="Missing run_id")
+    if not resolve_clay_run(str(run_id), data):
+        raise HTTPException(status_code=404, detail=f"No pending Clay run '{run_id}'")
+    return {"accepted": True, "run_id": str(run_id)}
+
+
+def _list_param(values: list[str] | None) -> list[str]:
+    """Repeated query values, still splitting the older comma-separated form."""
+    if not values:
+        return []
+    if len(values) == 1 and "," in values[0]:
+        return values[0].split(",")
+    return values
+
+
 @app.post("/api/waterfall/search-external")
 async def api_waterfall_search_external(
     client_id: str = Query(...),
     industry: str | None = Query(None),
-    title_keywords: str | None = Query(None),
-    locations: str | None = Query(None),
-    company_domains: str | None = Query(None),
+    title_keywords: Annotated[list[str] | None, Query()] = None,
+    locations: Annotated[list[str] | None, Query()] = None,
+    company_domains: Annotated[list[str] | None, Query()] = None,
     limit: int = Query(10, ge=1, le=100),
     provider: str | None = Query(None),
 ):
@@ -415,9 +655,9 @@ async def api_waterfall_search_external(
     criteria = SearchCriteria(
         client_id=client_id,
         industry=industry,
-        job_titles=title_keywords.split(",") if title_keywords else [],
-        locations=locations.split(",") if locations else [],
-        company_domains=company_domains.split(",") if company_domains else [],
+        job_titles=_list_param(title_keywords),
+        locations=_list_param(locations),
+        company_domains=_list_param(company_domains),
         limit=limit,
     )
 
@@ -428,16 +668,19 @@ async def api_waterfall_search_external(
         if not target_providers:
             raise HTTPException(status_code=404, detail=f"Provider '{provider}' not configured")
 
-    for p in target_providers:
-        try:
-            pr = await p.search_leads(criteria)
-            results[p.provider_name] = {
-                "leads": [lead.model_dump(mode="json") for lead in pr.leads],
-                "total_found": pr.total_found,
-                "credits_consumed": pr.credits_consumed,
-                "errors": pr.errors,
-            }
-        except Exception as e:
-            results[p.provider_name] = {"error": str(e)}
+    searches = await asyncio.gather(
+        *(waterfall.search_provider(p, criteria) for p in target_providers),
+        return_exceptions=True,
+    )
+    for p, pr in zip(target_providers, searches, strict=True):
+        if isinstance(pr, BaseException):
+            results[p.provider_name] = {"error": str(pr)}
+            continue
+        results[p.provider_name] = {
+            "leads": [lead.model_dump(mode="json") for lead in pr.leads],
+            "total_found": pr.total_found,
+            "credits_consumed": pr.credits_consumed,
+            "errors": pr.errors,
+        }
 
     return {"results": results}
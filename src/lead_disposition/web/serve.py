@@ -2,14 +2,28 @@
 
 import uvicorn
 
+from lead_disposition.core.config import Settings
+
 
 def main() -> None:
-    uvicorn.run(
-        "lead_disposition.web.app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-    )
+    settings = Settings()
+    if settings.env == "prod":
+        uvicorn.run(
+            "lead_disposition.web.app:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=settings.web_workers,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
+    else:
+        uvicorn.run(
+            "lead_disposition.web.app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+        )
 
 
 if __name__ == "__main__":
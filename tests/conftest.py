@@ -6,9 +6,36 @@ from datetime import datetime, timezone
 
 import pytest
 
+from lead_disposition.core.config import Settings
+from lead_disposition.core.database import Database
 from lead_disposition.core.models import Contact, DispositionStatus
 
 
+@pytest.fixture
+def sqlite_settings(tmp_path) -> Settings:
+    """Settings pointing at a throwaway SQLite database."""
+    return Settings(use_sqlite=True, sqlite_path=str(tmp_path / "disposition.db"))
+
+
+@pytest.fixture
+async def sqlite_db(sqlite_settings: Settings):
+    """A connected SQLite backend with the schema created."""
+    db = Database(sqlite_settings)
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def web_app(monkeypatch, tmp_path):
+    """The web app module, imported against SQLite so asyncpg isn't needed."""
+    monkeypatch.setenv("USE_SQLITE", "true")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "web.db"))
+    from lead_disposition.web import app as web_app
+
+    return web_app
+
+
 @pytest.fixture
 def make_contact():
     """Factory fixture for creating test contacts."""
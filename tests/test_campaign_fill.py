@@ -0,0 +1,80 @@
+"""Tests for assigning contacts to campaigns (SQLite-backed)."""
+
+from __future__ import annotations
+
+from lead_disposition.campaign_fill import CampaignFillEngine
+from lead_disposition.core.models import CampaignFillRequest, DispositionStatus
+
+
+def _request(volume: int, **kwargs) -> CampaignFillRequest:
+    return CampaignFillRequest(
+        campaign_id="camp_1", client_id="client_1", volume=volume, **kwargs
+    )
+
+
+class TestAssignContacts:
+    """Test assigning already-loaded contacts without re-querying eligibility."""
+
+    async def _load(self, db, make_contact, *emails: str, **kwargs):
+        contacts = []
+        for email in emails:
+            await db.create_contact(
+                make_contact(email=email, domain=email.split("@")[1], **kwargs)
+            )
+            contacts.append(await db.get_contact(email, "client_1"))
+        return contacts
+
+    async def test_assigns_and_claims_ownership(
+        self, sqlite_db, sqlite_settings, make_contact
+    ):
+        contacts = await self._load(sqlite_db, make_contact, "a@acme.com", "b@beta.io")
+        engine = CampaignFillEngine(sqlite_db, sqlite_settings)
+
+        result = await engine.assign_contacts(contacts, _request(5))
+
+        assert result.total_assigned == 2
+        assert result.fresh_count == 2
+        assert result.companies_touched == 2
+        assert "Volume shortfall: requested 5, assigned 2" in result.warnings
+        a = await sqlite_db.get_contact("a@acme.com", "client_1")
+        assert a.disposition_status == DispositionStatus.IN_SEQUENCE
+        assert a.sequence_count == 1
+        assert a.email_last_contacted is not None
+        company = await sqlite_db.get_company("acme.com")
+        assert company.client_owner_id == "client_1"
+        assert company.contacts_in_sequence == 1
+
+    async def test_skips_blocked_companies(self, sqlite_db, sqlite_settings, make_contact):
+        contacts = await self._load(
+            sqlite_db, make_contact,
+            "ok@acme.com", "hush@suppressed.com", "buyer@customer.com", "theirs@owned.com",
+        )
+        await sqlite_db.update_company_fields("suppressed.com", company_suppressed=True)
+        await sqlite_db.update_company_fields("customer.com", is_customer=True)
+        await sqlite_db.update_company_fields("owned.com", client_owner_id="client_2")
+
+        result = await CampaignFillEngine(sqlite_db, sqlite_settings).assign_contacts(
+            contacts, _request(4)
+        )
+
+        assert [c.email for c in result.contacts] == ["ok@acme.com"]
+        for email in ("hush@suppressed.com", "buyer@customer.com", "theirs@owned.com"):
+            contact = await sqlite_db.get_contact(email, "client_1")
+            assert contact.disposition_status == DispositionStatus.FRESH
+
+    async def test_title_filter_company_cap_and_volume(
+        self, sqlite_db, sqlite_settings, make_contact
+    ):
+        contacts = await self._load(
+            sqlite_db, make_contact, "a@acme.com", "b@acme.com", "c@acme.com", title="VP Sales"
+        )
+        contacts += await self._load(sqlite_db, make_contact, "d@beta.io", title="Engineer")
+        contacts += await self._load(sqlite_db, make_contact, "e@gamma.co", title="Head of Sales")
+        engine = CampaignFillEngine(sqlite_db, sqlite_settings)
+
+        result = await engine.assign_contacts(
+            contacts, _request(2, title_keywords=["Sales"], max_per_company=1)
+        )
+
+        # One per company, engineers filtered out, then trimmed to volume
+        assert [c.email for c in result.contacts] == ["a@acme.com", "e@gamma.co"]
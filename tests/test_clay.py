@@ -0,0 +1,136 @@
+"""Tests for the Clay provider and the callback route that wakes fills waiting on a run."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from lead_disposition.core.config import Settings
+from lead_disposition.providers import clay
+from lead_disposition.providers.base import ExternalLead, ProviderResult
+
+SECRET = "s3cret"
+CALLBACK = "/api/waterfall/clay/callback"
+
+
+@pytest.fixture
+def client(web_app, monkeypatch) -> TestClient:
+    monkeypatch.setattr(web_app.settings, "clay_callback_secret", SECRET)
+    # No lifespan: the callback route never touches the database
+    return TestClient(web_app.app)
+
+
+@pytest.fixture
+def pending_run(monkeypatch):
+    """Register a run ID as awaiting its callback."""
+    loop = asyncio.new_event_loop()
+    fut = loop.create_future()
+    monkeypatch.setitem(clay._pending_runs, "run_1", fut)
+    yield fut
+    loop.close()
+
+
+def test_callback_accepted(client: TestClient, pending_run):
+    payload = {"run_id": "run_1", "results": [{"email": "a@b.com"}]}
+    resp = client.post(CALLBACK, params={"token": SECRET}, json=payload)
+    assert resp.status_code == 200
+    assert resp.json() == {"accepted": True, "run_id": "run_1"}
+    assert pending_run.result() == payload
+
+
+def test_callback_unknown_run(client: TestClient):
+    resp = client.post(CALLBACK, params={"token": SECRET}, json={"run_id": "nope"})
+    assert resp.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"{not json", b"[1, 2]", b'{"results": []}'],
+    ids=["malformed", "not-an-object", "no-run-id"],
+)
+def test_callback_bad_body(client: TestClient, body: bytes):
+    resp = client.post(
+        CALLBACK,
+        params={"token": SECRET},
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize("params", [{}, {"token": "wrong"}], ids=["missing", "wrong"])
+def test_callback_rejected_without_secret(client: TestClient, pending_run, params):
+    resp = client.post(CALLBACK, params=params, json={"run_id": "run_1"})
+    assert resp.status_code == 401
+    assert not pending_run.done()
+
+
+def test_callback_rejected_when_no_secret_configured(web_app, client: TestClient, monkeypatch):
+    monkeypatch.setattr(web_app.settings, "clay_callback_secret", "")
+    resp = client.post(CALLBACK, params={"token": ""}, json={"run_id": "run_1"})
+    assert resp.status_code == 401
+
+
+def test_callback_url_carries_secret():
+    configured = Settings(clay_callback_url="https://app.example/cb", clay_callback_secret="a b")
+    provider = clay.ClayProvider(configured, receive_callbacks=True)
+    assert provider.callback_url == "https://app.example/cb?token=a+b"
+    # Without the secret, or outside the web process, runs are polled instead
+    no_secret = Settings(clay_callback_url="https://x/cb")
+    assert clay.ClayProvider(no_secret, receive_callbacks=True).callback_url is None
+    assert clay.ClayProvider(configured).callback_url is None
+
+
+async def test_callback_timeout_falls_back_to_polling(monkeypatch):
+    """A run whose callback never arrives is fetched by polling, not dropped."""
+    polled: list[str] = []
+
+    async def poll(self, run_id: str, max_wait: int = 180):
+        polled.append(run_id)
+        return ProviderResult(leads=[ExternalLead(email="a@b.com")])
+
+    monkeypatch.setattr(clay.ClayProvider, "_poll_results", poll)
+    provider = clay.ClayProvider(Settings(clay_api_key="key"), receive_callbacks=True)
+
+    result = await provider._wait_for_callback("run_1", max_wait=0)
+
+    assert polled == ["run_1"]
+    assert [lead.email for lead in result.leads] == ["a@b.com"]
+    assert "run_1" not in clay._pending_runs
+
+
+async def test_callback_timeout_without_api_key():
+    provider = clay.ClayProvider(Settings(), receive_callbacks=True)
+    result = await provider._wait_for_callback("run_1", max_wait=0)
+    assert result.errors == ["Clay run run_1 timed out after 0s"]
+
+
+async def test_poll_survives_transient_errors(monkeypatch):
+    """A timed-out poll waits for the next interval instead of abandoning the run."""
+    responses = iter([
+        httpx.ReadTimeout("slow"),
+        httpx.Response(200, json={"status": "running"}),
+        httpx.Response(200, json={"status": "completed", "results": [{"email": "a@b.com"}]}),
+    ])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(responses)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def no_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(clay.asyncio, "sleep", no_sleep)
+    provider = clay.ClayProvider(Settings(clay_api_key="key"))
+    provider.use_transport(httpx.MockTransport(handler))
+
+    result = await provider._poll_results("run_1")
+
+    assert result.errors == []
+    assert [lead.email for lead in result.leads] == ["a@b.com"]
+    await provider.close()
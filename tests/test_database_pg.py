@@ -0,0 +1,71 @@
+"""Tests for the PostgreSQL backend.
+
+Skipped unless asyncpg is installed and TEST_POSTGRES_DB names a scratch
+database with the disposition schema applied (see disposition-init-db). The
+other POSTGRES_* variables are read as usual.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from lead_disposition.core.config import Settings  # noqa: E402
+from lead_disposition.core.database_pg import PostgresDatabase  # noqa: E402
+from lead_disposition.core.models import CONTACT_ROW_COLUMNS  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("TEST_POSTGRES_DB"), reason="TEST_POSTGRES_DB not set"
+)
+
+
+@pytest.fixture
+async def pg_db():
+    db = PostgresDatabase(Settings(postgres_db=os.environ.get("TEST_POSTGRES_DB", "")))
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+async def client_id(pg_db):
+    """A client ID unique to this test; its contacts are removed afterwards."""
+    cid = f"test_{uuid.uuid4().hex}"
+    yield cid
+    await pg_db.pool.execute("DELETE FROM contacts WHERE client_id = $1", cid)
+
+
+def _row(email: str, client_id: str, first_name: str | None = None) -> tuple:
+    return (
+        email, client_id, "pg-test.example", first_name, None, None, None,
+        "fresh", None, "test", None,
+    )
+
+
+class TestBulkInsertContactRows:
+    """Test the COPY-to-staging insert path."""
+
+    async def test_inserts_batch(self, pg_db, client_id):
+        rows = [_row(f"p{i}@pg-test.example", client_id) for i in range(3)]
+        assert await pg_db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, rows) == 3
+
+    async def test_skips_existing_and_repeated_rows(self, pg_db, client_id):
+        await pg_db.bulk_insert_contact_rows(
+            CONTACT_ROW_COLUMNS, [_row("old@pg-test.example", client_id)]
+        )
+        rows = [
+            _row("old@pg-test.example", client_id),
+            _row("new@pg-test.example", client_id, "First"),
+            _row("new@pg-test.example", client_id, "Second"),
+        ]
+
+        assert await pg_db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, rows) == 1
+        new = await pg_db.get_contact("new@pg-test.example", client_id)
+        assert new.first_name == "First"
+        assert await pg_db.existing_contact_emails(
+            client_id, ["old@pg-test.example", "new@pg-test.example", "x@pg-test.example"]
+        ) == {"old@pg-test.example", "new@pg-test.example"}
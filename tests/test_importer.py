@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import io
+import threading
+
 import pytest
 
+from lead_disposition import importer
 from lead_disposition.core.models import Contact, DispositionStatus
+from lead_disposition.importer import CSVImporter
 
 
 class TestCSVColumnMapping:
@@ -52,3 +57,104 @@ class TestCSVColumnMapping:
         assert contact.company_domain == "acme.com"
         assert contact.disposition_status == DispositionStatus.FRESH
         assert contact.source_system == "csv"
+
+
+class TestCSVImportIntoDatabase:
+    """Test CSVImporter end to end against SQLite."""
+
+    async def test_imports_rows(self, sqlite_db, sqlite_settings):
+        csv_content = (
+            "email,first_name,last_name,company_domain,last_known_title,last_known_company\n"
+            "Jane@Acme.com,Jane,Smith,Acme.com,CTO,Acme Inc\n"
+            "bob@beta.io,Bob,,,,\n"
+        )
+        result = await CSVImporter(sqlite_db, sqlite_settings).import_csv_string(
+            csv_content, "client_1"
+        )
+
+        assert (result.total_rows, result.imported, result.duplicates, result.skipped) == (
+            2, 2, 0, 0,
+        )
+        jane = await sqlite_db.get_contact("jane@acme.com", "client_1")
+        assert jane.company_domain == "acme.com"
+        assert jane.last_known_title == "CTO"
+        assert jane.last_known_company == "Acme Inc"
+        assert jane.source_system == "csv"
+        assert jane.source_id == "csv_string"
+        bob = await sqlite_db.get_contact("bob@beta.io", "client_1")
+        assert bob.company_domain == "beta.io"  # derived from the email
+        assert bob.last_name is None
+
+    async def test_short_and_blank_rows(self, sqlite_db, sqlite_settings):
+        """Rows missing trailing cells are padded; blank lines are ignored."""
+        csv_content = (
+            "email,first_name,last_name,company_domain,last_known_title\n"
+            "short@acme.com,Sam\n"
+            "\n"
+            "only@beta.io\n"
+        )
+        result = await CSVImporter(sqlite_db, sqlite_settings).import_csv_string(
+            csv_content, "client_1"
+        )
+
+        assert result.imported == 2
+        assert result.errors == []
+        short = await sqlite_db.get_contact("short@acme.com", "client_1")
+        assert short.first_name == "Sam"
+        assert short.company_domain == "acme.com"
+        assert short.last_known_title is None
+
+    async def test_missing_columns_and_invalid_emails(self, sqlite_db, sqlite_settings):
+        """Columns absent from the header read as empty; bad emails are reported."""
+        csv_content = "email\nnoatsign\nok@acme.com\n,\n"
+        result = await CSVImporter(sqlite_db, sqlite_settings).import_csv_string(
+            csv_content, "client_1"
+        )
+
+        assert result.imported == 1
+        assert result.skipped == 2
+        assert result.errors == [
+            "Row 2: invalid or missing email",
+            "Row 4: invalid or missing email",
+        ]
+        ok = await sqlite_db.get_contact("ok@acme.com", "client_1")
+        assert ok.first_name is None
+
+    async def test_custom_column_map_and_duplicates(self, sqlite_db, sqlite_settings):
+        csv_content = "Work Email,Job Title\nx@acme.com,VP Sales\nX@acme.com,CEO\n"
+        column_map = {"email": "Work Email", "title": "Job Title"}
+        result = await CSVImporter(sqlite_db, sqlite_settings).import_csv_string(
+            csv_content, "client_1", column_map
+        )
+
+        assert result.imported == 1
+        assert result.duplicates == 1
+        contact = await sqlite_db.get_contact("x@acme.com", "client_1")
+        assert contact.last_known_title == "VP Sales"
+
+    async def test_batches_and_parses_off_the_event_loop(
+        self, sqlite_db, sqlite_settings, monkeypatch
+    ):
+        """Uploads are read in a worker thread; only inserts run on the loop."""
+        monkeypatch.setattr(importer, "IMPORT_BATCH_SIZE", 2)
+        loop_thread = threading.get_ident()
+        read_threads: set[int] = set()
+
+        class RecordingStream(io.BytesIO):
+            def read1(self, size=-1):
+                read_threads.add(threading.get_ident())
+                return super().read1(size)
+
+            def read(self, size=-1):
+                read_threads.add(threading.get_ident())
+                return super().read(size)
+
+        body = "email\n" + "".join(f"u{i}@acme.com\n" for i in range(5))
+        stream = RecordingStream(body.encode())
+        result = await CSVImporter(sqlite_db, sqlite_settings).import_csv_stream(
+            stream, "client_1"
+        )
+
+        assert (result.total_rows, result.imported) == (5, 5)
+        assert read_threads and loop_thread not in read_threads
+        assert not stream.closed
@@ -0,0 +1,65 @@
+"""Tests for the Jina Reader provider."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from lead_disposition.core.config import Settings
+from lead_disposition.providers.jina import EMAIL_PATTERN, STREAM_TAIL_CHARS, JinaProvider
+
+
+def _provider(handler) -> JinaProvider:
+    provider = JinaProvider(Settings(jina_api_key="key"))
+    provider.use_transport(httpx.MockTransport(handler))
+    return provider
+
+
+@pytest.mark.parametrize(
+    "status,healthy",
+    [(200, True), (204, True), (405, True), (401, False), (403, False), (429, False), (503, False)],
+    ids=["ok", "no-content", "head-not-allowed", "bad-key", "forbidden", "rate-limited", "down"],
+)
+async def test_probe_health_status(status: int, healthy: bool):
+    provider = _provider(lambda request: httpx.Response(status))
+    assert await provider._probe_health() is healthy
+    await provider.close()
+
+
+async def test_probe_health_connection_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    provider = _provider(handler)
+    assert await provider._probe_health() is False
+    await provider.close()
+
+
+def _chunked(body: str, size: int):
+    async def stream():
+        for i in range(0, len(body), size):
+            yield body[i:i + size].encode()
+
+    return stream()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, STREAM_TAIL_CHARS, 1000])
+async def test_stream_emails_matches_whole_body(chunk_size: int):
+    """Addresses split across chunk boundaries are found exactly once, in order."""
+    filler = "x " * STREAM_TAIL_CHARS
+    body = (
+        "Jane.Doe@acme.com " + filler
+        + "bob@beta.io, " + "a" * 100 + "@long-local.com "
+        + filler + "sales@acme.co.uk"
+    )
+    expected = [m.group("local", "domain") for m in EMAIL_PATTERN.finditer(body)]
+    provider = _provider(
+        lambda request: httpx.Response(200, content=_chunked(body, chunk_size))
+    )
+
+    status, addresses = await provider._stream_emails("https://r.jina.ai/https://acme.com")
+
+    assert status == 200
+    assert addresses == expected
+    assert len(addresses) == 4
+    await provider.close()
@@ -0,0 +1,39 @@
+"""Tests for the HTTP plumbing shared by every provider."""
+
+from __future__ import annotations
+
+import httpx
+
+from lead_disposition.core.config import Settings
+from lead_disposition.providers.jina import JinaProvider
+from lead_disposition.providers.spider import SpiderProvider
+
+
+class TrackingTransport(httpx.AsyncBaseTransport):
+    """Answers 200 until closed, and records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert not self.closed, "request sent through a closed transport"
+        return httpx.Response(200)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def test_closing_one_provider_keeps_shared_transport_open():
+    shared = TrackingTransport()
+    settings = Settings(jina_api_key="key", spider_api_key="key")
+    jina, spider = JinaProvider(settings), SpiderProvider(settings)
+    for p in (jina, spider):
+        p.use_transport(shared)
+        await p._probe_health()
+
+    await jina.close()
+
+    assert not shared.closed
+    assert await spider._probe_health() is True
+    await spider.close()
+    assert not shared.closed  # the owner closes it, once
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 from lead_disposition.core.models import DispositionStatus
@@ -205,3 +207,77 @@ class TestAllTransitionsHaveScenarios:
         """No state should list itself as a valid transition target."""
         for status, targets in TRANSITIONS.items():
             assert status not in targets, f"{status.value} lists itself as a transition target"
+
+
+# ---------------------------------------------------------------------------
+# Set-based sweeps (SQLite-backed)
+# ---------------------------------------------------------------------------
+
+
+class TestSweeps:
+    """Test the cooldown and stale-data sweeps against a real database."""
+
+    async def _add(self, db, make_contact, email, status, **fields):
+        domain = email.split("@")[1]
+        await db.create_contact(make_contact(email=email, domain=domain, status=status))
+        if fields:
+            await db.update_contact_fields(email, "client_1", **fields)
+
+    async def test_expired_cooldowns_become_retouch_eligible(
+        self, sqlite_db, sqlite_settings, make_contact
+    ):
+        now = datetime.now(UTC)
+        await self._add(
+            sqlite_db, make_contact, "done@a.com", DispositionStatus.COMPLETED_NO_RESPONSE,
+            email_cooldown_until=now - timedelta(days=1),
+        )
+        await self._add(
+            sqlite_db, make_contact, "waiting@b.com", DispositionStatus.REPLIED_NEUTRAL,
+            email_cooldown_until=now + timedelta(days=1),
+        )
+        # Expired cooldown but a status the sweep never moves
+        await self._add(
+            sqlite_db, make_contact, "seq@c.com", DispositionStatus.IN_SEQUENCE,
+            email_cooldown_until=now - timedelta(days=1),
+        )
+
+        moved = await StateMachine(sqlite_db, sqlite_settings).process_expired_cooldowns()
+
+        assert moved == 1
+        done = await sqlite_db.get_contact("done@a.com", "client_1")
+        assert done.disposition_status == DispositionStatus.RETOUCH_ELIGIBLE
+        history = await sqlite_db.get_contact_history("done@a.com", "client_1")
+        assert len(history) == 1
+        assert history[0]["previous_status"] == "completed_no_response"
+        assert history[0]["new_status"] == "retouch_eligible"
+        assert history[0]["transition_reason"] == "cooldown_expired"
+        for email, status in [
+            ("waiting@b.com", DispositionStatus.REPLIED_NEUTRAL),
+            ("seq@c.com", DispositionStatus.IN_SEQUENCE),
+        ]:
+            contact = await sqlite_db.get_contact(email, "client_1")
+            assert contact.disposition_status == status
+            assert await sqlite_db.get_contact_history(email, "client_1") == []
+
+    async def test_stale_contacts_flagged(self, sqlite_db, sqlite_settings, make_contact):
+        old = datetime.now(UTC) - timedelta(days=365)
+        await sqlite_db.create_contact(make_contact(
+            email="old@a.com", domain="a.com", enriched_at=old,
+        ))
+        await sqlite_db.create_contact(make_contact(email="new@b.com", domain="b.com"))
+        # Terminal statuses can't move to stale_data however old the data is
+        await sqlite_db.create_contact(make_contact(
+            email="gone@c.com", domain="c.com", status=DispositionStatus.BOUNCED, enriched_at=old,
+        ))
+
+        moved = await StateMachine(sqlite_db, sqlite_settings).process_stale_data()
+
+        assert moved == 1
+        stale = await sqlite_db.get_contact("old@a.com", "client_1")
+        assert stale.disposition_status == DispositionStatus.STALE_DATA
+        history = await sqlite_db.get_contact_history("old@a.com", "client_1")
+        assert [h["previous_status"] for h in history] == ["fresh"]
+        fresh = await sqlite_db.get_contact("new@b.com", "client_1")
+        assert fresh.disposition_status == DispositionStatus.FRESH
+        gone = await sqlite_db.get_contact("gone@c.com", "client_1")
+        assert gone.disposition_status == DispositionStatus.BOUNCED
@@ -2,98 +2,128 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import operator
+
 import pytest
 
 from lead_disposition.core.config import Settings
 from lead_disposition.core.models import TAMHealth
+from lead_disposition.tam_tracker import TAMTracker
+
+
+@functools.cache
+def _settings() -> Settings:
+    """One Settings per process; env parsing and validation run once."""
+    return Settings()
+
+
+@pytest.fixture(scope="module")
+def settings() -> Settings:
+    return _settings()
+
 
-
-class TestTAMHealthStatus:
-    """Test TAM health status derivation."""
-
-    def test_healthy_when_eta_above_warning(self):
-        settings = Settings()
-        eta = 12.0
-        status = "healthy"
-        if eta < settings.tam_critical_weeks:
-            status = "critical"
-        elif eta < settings.tam_warning_weeks:
-            status = "warning"
-        assert status == "healthy"
-
-    def test_warning_when_eta_between_thresholds(self):
-        settings = Settings()
-        eta = 6.0  # between critical (4) and warning (8)
-        status = "healthy"
-        if eta < settings.tam_critical_weeks:
-            status = "critical"
-        elif eta < settings.tam_warning_weeks:
-            status = "warning"
-        assert status == "warning"
-
-    def test_critical_when_eta_below_critical(self):
-        settings = Settings()
-        eta = 2.0
-        status = "healthy"
-        if eta < settings.tam_critical_weeks:
-            status = "critical"
-        elif eta < settings.tam_warning_weeks:
-            status = "warning"
-        assert status == "critical"
-
-    def test_healthy_when_no_burn(self):
-        """Zero burn rate = no exhaustion = healthy."""
-        health = TAMHealth(
-            total_universe=1000,
-            available_now=500,
-            burn_rate_weekly=0.0,
-            exhaustion_eta_weeks=None,
-            health_status="healthy",
-        )
-        assert health.health_status == "healthy"
-        assert health.exhaustion_eta_weeks is None
-
-
-class TestExhaustionETA:
-    """Test exhaustion ETA calculations."""
-
-    def test_basic_calculation(self):
-        available = 100
-        burn_rate = 25.0
-        eta = available / burn_rate
-        assert eta == 4.0
-
-    def test_zero_burn_rate_returns_none(self):
-        burn_rate = 0.0
-        eta = None if burn_rate == 0 else 100 / burn_rate
-        assert eta is None
-
-    def test_high_available_low_burn(self):
-        available = 10000
-        burn_rate = 50.0
-        eta = available / burn_rate
-        assert eta == 200.0
-
-
-class TestPoolSegmentation:
-    """Test that pool categories are mutually exclusive and sum to total."""
-
-    def test_pools_sum_to_total(self):
-        health = TAMHealth(
-            total_universe=1000,
-            never_touched=400,
-            in_cooldown=100,
-            available_now=300,
-            permanent_suppress=50,
-            in_sequence=100,
-            won_customer=50,
-        )
-        pool_sum = (
-            health.never_touched
-            + health.in_cooldown
-            + health.available_now
-            + health.permanent_suppress
-            + health.in_sequence
-            + health.won_customer
-        )
-        assert pool_sum == health.total_universe
+def _mk_health(**kwargs) -> TAMHealth:
+    """Build a trusted TAMHealth fixture without running field validation."""
+    return TAMHealth.model_construct(**kwargs)
+
+
+STATUS_CASES = [
+    (12.0, "healthy"),
+    (6.0, "warning"),  # between critical (4) and warning (8)
+    (2.0, "critical"),
+    (4.0, "warning"),  # thresholds are exclusive upper bounds
+    (8.0, "healthy"),
+    (None, "healthy"),  # zero burn rate never exhausts
+]
+STATUS_IDS = ["healthy", "warning", "critical", "at-critical", "at-warning", "no-burn"]
+
+ETA_CASES = [
+    (100, 25.0, 4.0),
+    (10000, 50.0, 200.0),
+    (100, 0.0, None),
+]
+ETA_IDS = ["short", "long", "no-burn"]
+
+_POOL_FIELDS = (
+    "never_touched",
+    "in_cooldown",
+    "available_now",
+    "permanent_suppress",
+    "in_sequence",
+    "won_customer",
+)
+_POOL_GET = operator.attrgetter(*_POOL_FIELDS)
+
+_POOLS = {
+    "never_touched": 400,
+    "in_cooldown": 100,
+    "available_now": 300,
+    "permanent_suppress": 50,
+    "in_sequence": 100,
+    "won_customer": 50,
+}
+
+POOL_CASES = [
+    _POOLS,
+    {"never_touched": 1000},
+    {"in_cooldown": 10, "available_now": 5, "won_customer": 1},
+    {"permanent_suppress": 7, "in_sequence": 3},
+]
+POOL_IDS = ["all-pools", "untouched-only", "mixed", "suppressed"]
+
+
+@pytest.mark.parametrize("eta,expected", STATUS_CASES, ids=STATUS_IDS)
+def test_status_from_eta(eta: float | None, expected: str, settings: Settings):
+    assert TAMHealth.derive_status(eta, settings) == expected
+
+
+def test_status_sweep_is_monotonic(settings: Settings):
+    """Sweeping ETA upward only ever moves critical -> warning -> healthy."""
+    rank = {"critical": 0, "warning": 1, "healthy": 2}
+    etas = [i / 4 for i in range(80)]  # 0-20 weeks in quarter-week steps
+    ranks = [rank[TAMHealth.derive_status(eta, settings)] for eta in etas]
+    assert ranks == sorted(ranks)
+    assert set(ranks) == {0, 1, 2}
+
+
+@pytest.mark.parametrize("available,burn_rate,expected", ETA_CASES, ids=ETA_IDS)
+def test_exhaustion_eta(available: int, burn_rate: float, expected: float | None):
+    eta = None if burn_rate == 0 else available / burn_rate
+    assert eta == expected
+
+
+@pytest.mark.parametrize("pools", POOL_CASES, ids=POOL_IDS)
+def test_pools_sum_to_total(pools: dict[str, int]):
+    """Pool categories are mutually exclusive and sum to the total universe."""
+    assert set(pools) <= set(_POOL_FIELDS)
+    health = _mk_health(total_universe=sum(pools.values()), **pools)
+    assert sum(_POOL_GET(health)) == health.total_universe
+
+
+def test_trusted_fixture_matches_validated():
+    """model_construct is only safe while TAMHealth adds no coercion or validators."""
+    pools = {"total_universe": 1000, **_POOLS}
+    assert _mk_health(**pools) == TAMHealth(**pools)
+
+
+async def test_health_locks_dropped_after_fill(sqlite_db, sqlite_settings: Settings):
+    """Concurrent misses share one fill, and no per-client lock outlives it."""
+    tracker = TAMTracker(sqlite_db, sqlite_settings)
+    calls: list[str | None] = []
+    fresh = tracker._get_health_fresh
+
+    async def counting_fresh(client_id=None):
+        calls.append(client_id)
+        await asyncio.sleep(0)
+        return await fresh(client_id)
+
+    tracker._get_health_fresh = counting_fresh
+
+    readings = await asyncio.gather(*(tracker.get_health("client_1") for _ in range(5)))
+    await asyncio.gather(*(tracker.get_health(f"client_{i}") for i in range(2, 50)))
+
+    assert calls.count("client_1") == 1
+    assert all(r is readings[0] for r in readings)
+    assert tracker._health_locks == {}
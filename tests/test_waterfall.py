@@ -0,0 +1,87 @@
+"""Tests for the external provider cascade in the waterfall engine."""
+
+from __future__ import annotations
+
+from lead_disposition.core.config import Settings
+from lead_disposition.providers.base import (
+    ExternalLead,
+    LeadProvider,
+    ProviderResult,
+    SearchCriteria,
+)
+from lead_disposition.waterfall.engine import WaterfallEngine, WaterfallFillRequest
+
+
+class FakeProvider(LeadProvider):
+    """Returns up to `limit` of a fixed list of emails, billing per lead."""
+
+    def __init__(self, name: str, priority: int, emails: list[str], credits_per_lead=1.0):
+        self.provider_name = name
+        self.priority = priority
+        self.emails = emails
+        self.credits_per_lead = credits_per_lead
+        self.limits: list[int] = []
+
+    async def search_leads(self, criteria: SearchCriteria) -> ProviderResult:
+        self.limits.append(criteria.limit)
+        emails = self.emails[: criteria.limit]
+        return ProviderResult(
+            leads=[
+                ExternalLead(
+                    email=e, company_domain=e.split("@")[1], source_provider=self.provider_name
+                )
+                for e in emails
+            ],
+            total_found=len(emails),
+            credits_consumed=len(emails) * self.credits_per_lead,
+        )
+
+    async def _probe_health(self) -> bool:
+        return True
+
+
+def _request(volume: int, **kwargs) -> WaterfallFillRequest:
+    return WaterfallFillRequest(campaign_id="camp_1", client_id="client_1", volume=volume, **kwargs)
+
+
+def _emails(prefix: str, n: int) -> list[str]:
+    return [f"{prefix}{i}@{prefix}{i}.com" for i in range(n)]
+
+
+async def test_later_provider_skipped_once_filled(sqlite_db, sqlite_settings: Settings):
+    first = FakeProvider("ai_ark", 1, _emails("a", 5))
+    second = FakeProvider("clay", 2, _emails("b", 5))
+    engine = WaterfallEngine(sqlite_db, [first, second], sqlite_settings)
+
+    result = await engine.fill_campaign(_request(3))
+
+    assert first.limits == [3]
+    assert second.limits == []
+    assert result.per_provider_counts == {"internal": 0, "ai_ark": 3}
+    assert result.credits_consumed == {"ai_ark": 3.0}
+    assert result.total_assigned == 3
+
+
+async def test_later_provider_asked_only_for_remainder(sqlite_db, sqlite_settings: Settings):
+    first = FakeProvider("ai_ark", 1, ["x@x.com", "y@y.com"])
+    second = FakeProvider("clay", 2, ["y@y.com", "z@z.com"])
+    engine = WaterfallEngine(sqlite_db, [first, second], sqlite_settings)
+
+    result = await engine.fill_campaign(_request(4))
+
+    assert second.limits == [2]
+    # y@y.com was already found by the higher-priority provider
+    assert result.per_provider_counts == {"internal": 0, "ai_ark": 2, "clay": 1}
+    assert result.total_assigned == 3
+
+
+async def test_credit_cap_stops_cascade(sqlite_db, sqlite_settings: Settings):
+    first = FakeProvider("ai_ark", 1, _emails("a", 2), credits_per_lead=5.0)
+    second = FakeProvider("clay", 2, _emails("b", 5))
+    engine = WaterfallEngine(sqlite_db, [first, second], sqlite_settings)
+
+    result = await engine.fill_campaign(_request(5, max_external_credits=10.0))
+
+    assert second.limits == []
+    assert result.credits_consumed == {"ai_ark": 10.0}
+    assert any(w.startswith("Credit limit reached") for w in result.warnings)
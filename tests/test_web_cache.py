@@ -0,0 +1,33 @@
+"""Tests for the web app's cached listings and their ETags."""
+
+from __future__ import annotations
+
+import orjson
+from starlette.requests import Request
+
+
+async def test_listing_etag_tracks_content(web_app, monkeypatch):
+    monkeypatch.setattr(web_app, "_listing_cache", {})
+    items = ["client_a", "client_b"]
+
+    async def load():
+        return {"items": list(items)}
+
+    etag, body = await web_app._cached_listing("clients", None, load)
+    assert orjson.loads(body) == {"items": ["client_a", "client_b"]}
+
+    # A reload of unchanged data (TTL roll, another worker) keeps the ETag
+    web_app._listing_cache.clear()
+    assert await web_app._cached_listing("clients", None, load) == (etag, body)
+
+    items.append("client_c")
+    web_app._invalidate_listing("clients")
+    new_etag, _ = await web_app._cached_listing("clients", None, load)
+    assert new_etag != etag
+
+
+def test_not_modified_matches_etag(web_app):
+    scope = {"type": "http", "headers": [(b"if-none-match", b'"abc", "def"')]}
+    resp = web_app._not_modified(Request(scope), '"def"')
+    assert resp is not None and resp.status_code == 304
+    assert web_app._not_modified(Request(scope), '"xyz"') is None
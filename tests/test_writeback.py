@@ -0,0 +1,89 @@
+"""Tests for writing externally-sourced leads back to the database."""
+
+from __future__ import annotations
+
+from lead_disposition.core.models import CONTACT_ROW_COLUMNS, DispositionStatus
+from lead_disposition.providers.base import ExternalLead
+from lead_disposition.waterfall.writeback import write_back_leads
+
+
+def _lead(email: str, **kwargs) -> ExternalLead:
+    return ExternalLead(email=email, source_provider="ai_ark", **kwargs)
+
+
+class TestWriteBack:
+    """Test dedup, validation and insertion of external leads."""
+
+    async def test_inserts_new_leads(self, sqlite_db):
+        leads = [
+            _lead("Jane.Doe@Acme.com", first_name="Jane", title="CTO"),
+            _lead("bob@beta.io", company_domain="beta.io"),
+        ]
+        result = await write_back_leads(sqlite_db, leads, "client_1")
+
+        assert result.total_processed == 2
+        assert result.new_inserted == 2
+        assert result.duplicates_skipped == 0
+        assert [c.email for c in result.inserted_contacts] == ["jane.doe@acme.com", "bob@beta.io"]
+
+        jane = await sqlite_db.get_contact("jane.doe@acme.com", "client_1")
+        assert jane.company_domain == "acme.com"
+        assert jane.first_name == "Jane"
+        assert jane.last_known_title == "CTO"
+        assert jane.disposition_status == DispositionStatus.FRESH
+        assert jane.source_system == "ai_ark"
+        assert jane.data_enriched_at is not None
+        company = await sqlite_db.get_company("acme.com")
+        assert company.contacts_total == 1
+
+    async def test_skips_repeats_and_invalid(self, sqlite_db):
+        leads = [
+            _lead("a@acme.com"),
+            _lead("A@ACME.com"),  # same person, different case
+            _lead("not-an-email"),
+            _lead(""),
+        ]
+        result = await write_back_leads(sqlite_db, leads, "client_1")
+
+        assert result.new_inserted == 1
+        assert result.duplicates_skipped == 1
+        assert result.invalid_skipped == 2
+
+    async def test_skips_existing_contacts(self, sqlite_db, make_contact):
+        await sqlite_db.create_contact(make_contact(email="old@acme.com", domain="acme.com"))
+
+        result = await write_back_leads(
+            sqlite_db, [_lead("old@acme.com"), _lead("new@acme.com")], "client_1"
+        )
+
+        assert result.new_inserted == 1
+        assert result.duplicates_skipped == 1
+        assert [c.email for c in result.inserted_contacts] == ["new@acme.com"]
+        # The existing contact is left as it was
+        old = await sqlite_db.get_contact("old@acme.com", "client_1")
+        assert old.source_system != "ai_ark"
+        company = await sqlite_db.get_company("acme.com")
+        assert company.contacts_total == 2
+
+    async def test_same_email_for_another_client_is_new(self, sqlite_db, make_contact):
+        await sqlite_db.create_contact(make_contact(email="shared@acme.com", domain="acme.com"))
+
+        result = await write_back_leads(sqlite_db, [_lead("shared@acme.com")], "client_2")
+
+        assert result.new_inserted == 1
+        assert await sqlite_db.get_contact("shared@acme.com", "client_2") is not None
+
+
+class TestBulkInsertContactRows:
+    """Test the raw row insert shared by write-back and CSV import."""
+
+    async def test_ignores_duplicate_rows(self, sqlite_db):
+        row = (
+            "x@acme.com", "client_1", "acme.com", None, None, None, None,
+            "fresh", None, "csv", None,
+        )
+        assert await sqlite_db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, [row]) == 1
+        assert await sqlite_db.bulk_insert_contact_rows(CONTACT_ROW_COLUMNS, [row]) == 0
+        assert await sqlite_db.existing_contact_emails(
+            "client_1", ["x@acme.com", "y@acme.com"]
+        ) == {"x@acme.com"}